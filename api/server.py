@@ -1,5 +1,6 @@
 import os
 import sys
+import gc
 from flask import Flask, Response, request, render_template_string
 import json
 import base64
@@ -14,12 +15,62 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 # Import your modules
 try:
     from nlp_modules.skill_extractor import SkillExtractor
+    from nlp_modules.result_cache import ResultCache
+    from nlp_modules.engine_reloader import EngineReloader
     from utils.skill_analyzer import SkillAnalyzer
     from utils.shared import create_progress_ring, create_skill_bar_chart, create_skill_radar_chart, display_skill_cards
     import plotly.utils
 except ImportError as e:
     print(f"Import error: {e}")
 
+# Knowledge base: job_skills.json or a compiled artifact of it
+# (python -m nlp_modules.kb_artifact build)
+JOB_SKILLS_PATH = os.environ.get(
+    'RESUME_ANALYZER_KB',
+    os.path.join(os.path.dirname(__file__), '..', 'data', 'job_skills.json')
+)
+
+WARMUP_RESUME = """
+Software engineer with experience in Python, JavaScript, SQL, Docker and AWS.
+Built REST APIs with Flask and React front ends, deployed with CI/CD.
+"""
+
+# Process-wide skill engine, loaded once per process and shared read-only by
+# all requests. Loading at import time means `gunicorn --preload` builds it in
+# the master, and forked workers share its pages copy-on-write. Edits to the
+# knowledge base are picked up by a per-process watcher, which builds a new
+# engine off the request path and swaps it in (0 disables reloading).
+RELOAD_INTERVAL = float(os.environ.get('RESUME_ANALYZER_RELOAD_INTERVAL', '5'))
+
+def build_engine(path: str) -> 'SkillExtractor':
+    """Build a skill engine and run its first-call setup before it serves requests"""
+    engine = SkillExtractor(path, result_cache=result_cache)
+    engine.rank_roles(engine.extract_skills_combined(WARMUP_RESUME))
+    return engine
+
+try:
+    # Extraction results are cached by resume content, shared across request
+    # threads and engine versions (keys include the knowledge base version)
+    result_cache = ResultCache(max_entries=2048, max_bytes=64 * 1024 * 1024)
+    engine_reloader = EngineReloader(JOB_SKILLS_PATH, build_engine, interval=RELOAD_INTERVAL)
+except Exception as e:
+    print(f"Skill engine load error: {e}")
+    result_cache = None
+    engine_reloader = None
+
+# SkillAnalyzer holds no knowledge base state and is safe to share, so one
+# instance serves all request threads and keeps its requirement vectors warm
+try:
+    skill_analyzer = SkillAnalyzer()
+except Exception as e:
+    print(f"Skill analyzer load error: {e}")
+    skill_analyzer = None
+
+def current_engine() -> 'SkillExtractor':
+    """Engine for one request; fetch it once so the request sees one version"""
+    engine_reloader.ensure_watching()
+    return engine_reloader.engine
+
 # HTML Template
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -347,9 +398,7 @@ def index():
     """Serve the main page"""
     try:
         # Get job roles for the dropdown
-        job_skills_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'job_skills.json')
-        skill_extractor = SkillExtractor(job_skills_path)
-        job_roles = skill_extractor.get_all_job_roles()
+        job_roles = current_engine().get_all_job_roles()
         
         job_options = ''.join([f'<option value="{role}">{role}</option>' for role in job_roles])
         
@@ -368,38 +417,121 @@ def analyze():
         if not resume_text or not job_role:
             return {'success': False, 'error': 'Missing resume text or job role'}
         
-        # Initialize components
-        job_skills_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'job_skills.json')
-        skill_extractor = SkillExtractor(job_skills_path)
-        skill_analyzer = SkillAnalyzer()
+        skill_extractor = current_engine()
         
-        # Extract skills
-        resume_skills = skill_extractor.extract_skills_combined(resume_text)
-        required_skills = skill_extractor.get_job_role_skills(job_role)
+        return {
+            'success': True,
+            'knowledge_base_version': skill_extractor.knowledge_base_version,
+            'results': analyze_resume(skill_extractor, resume_text, job_role)
+        }
         
-        # Analyze
-        analysis_results = skill_analyzer.analyze_skill_gaps(resume_skills, required_skills)
+    except Exception as e:
+        return {'success': False, 'error': str(e)}
+
+def analyze_resume(skill_extractor: 'SkillExtractor', resume_text: str, job_role: str) -> Dict:
+    """
+    Skill gap analysis of a resume for a role, with its charts
+    
+    Args:
+        skill_extractor: Engine to extract skills with
+        resume_text: Resume text
+        job_role: Job role to analyze against
         
-        # Create charts
-        skill_chart = create_skill_bar_chart(analysis_results['matched_skills'], analysis_results['missing_skills'])
-        radar_chart = create_skill_radar_chart(analysis_results, analysis_results.get('category_analysis', {}))
+    Returns:
+        Analysis results including chart JSON
+    """
+    # Extract skills
+    resume_skills = skill_extractor.extract_skills_combined(resume_text)
+    required_skills = skill_extractor.get_job_role_skills(job_role)
+    
+    # Analyze
+    analysis_results = skill_analyzer.analyze_skill_gaps(resume_skills, required_skills)
+    
+    # Create charts
+    skill_chart = create_skill_bar_chart(analysis_results['matched_skills'], analysis_results['missing_skills'])
+    radar_chart = create_skill_radar_chart(analysis_results, analysis_results.get('category_analysis', {}))
+    
+    # Convert charts to JSON
+    skill_chart_json = json.loads(skill_chart.to_json())
+    radar_chart_json = json.loads(radar_chart.to_json())
+    
+    return {
+        **analysis_results,
+        'skill_chart': skill_chart_json,
+        'radar_chart': radar_chart_json
+    }
+
+@app.route('/roles/rank', methods=['POST'])
+def rank_roles():
+    """Rank all job roles for a resume"""
+    try:
+        data = request.get_json()
+        resume_text = data.get('resume_text', '')
+        top_k = int(data.get('top_k', 5))
+        
+        if not resume_text:
+            return {'success': False, 'error': 'Missing resume text'}
         
-        # Convert charts to JSON
-        skill_chart_json = json.loads(skill_chart.to_json())
-        radar_chart_json = json.loads(radar_chart.to_json())
+        # Extract skills and score every role at once
+        skill_extractor = current_engine()
+        resume_skills = skill_extractor.extract_skills_combined(resume_text)
+        ranking = skill_extractor.rank_roles(resume_skills, top_k)
         
         return {
             'success': True,
-            'results': {
-                **analysis_results,
-                'skill_chart': skill_chart_json,
-                'radar_chart': radar_chart_json
-            }
+            'knowledge_base_version': skill_extractor.knowledge_base_version,
+            'results': ranking
         }
         
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
+@app.route('/kb/version')
+def kb_version():
+    """Report the knowledge base version being served and reload status"""
+    if engine_reloader is None:
+        return {'success': False, 'error': 'Skill engine not available'}
+    return {
+        'success': True,
+        'knowledge_base_version': current_engine().knowledge_base_version,
+        'results': {
+            'path': engine_reloader.path,
+            'reloads': engine_reloader.reloads,
+            'reload_interval': engine_reloader.interval,
+            'last_error': engine_reloader.last_error
+        }
+    }
+
+@app.route('/cache/stats')
+def cache_stats():
+    """Report result cache counters"""
+    if result_cache is None:
+        return {'success': False, 'error': 'Result cache not available'}
+    return {'success': True, 'results': result_cache.stats()}
+
+def warm_up():
+    """Run one dummy analysis so lazy imports and first-call setup happen before serving"""
+    if engine_reloader is None or skill_analyzer is None:
+        return
+    
+    # The engine is used directly rather than through current_engine(), so the
+    # reload watcher is not started here: with --preload this runs in the
+    # master, which never serves requests. Each worker starts its own watcher
+    # on its first request.
+    try:
+        engine = engine_reloader.engine
+        job_roles = engine.get_all_job_roles()
+        if job_roles:
+            analyze_resume(engine, WARMUP_RESUME, job_roles[0])
+    except Exception as e:
+        print(f"Warm-up error: {e}")
+    
+    # Keep the warmed engine out of future GC passes so collections in forked
+    # workers do not touch (and copy) its pages
+    gc.freeze()
+
+warm_up()
+
 # Handler for Vercel
 def handler(request):
     return app(request.environ, lambda status, headers: None)
@@ -17,10 +17,8 @@ from typing import Dict, List
 sys.path.append(os.path.join(os.path.dirname(__file__), 'nlp_modules'))
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
-from nlp_modules.skill_extractor import SkillExtractor
-from utils.pdf_extractor import PDFExtractor
-from utils.skill_analyzer import SkillAnalyzer
 from utils.shared import set_custom_css, create_progress_ring, create_skill_bar_chart, create_skill_radar_chart, display_skill_cards
+from utils.shared import load_skill_extractor, get_file_digest, extract_resume_text, extract_resume_skills, analyze_resume_for_role
 
 # Page configuration
 st.set_page_config(
@@ -163,7 +161,7 @@ else:
         job_skills_path = os.path.join(os.path.dirname(__file__), 'data', 'job_skills.json')
         
         try:
-            skill_extractor = SkillExtractor(job_skills_path)
+            skill_extractor = load_skill_extractor(job_skills_path)
             job_roles = skill_extractor.get_all_job_roles()
             selected_job_role = st.selectbox(
                 "Choose your target role",
@@ -207,7 +205,8 @@ else:
             else:
                 # Extract text from uploaded file
                 with st.spinner("📄 Extracting text from resume..."):
-                    resume_text = PDFExtractor.extract_text_from_uploaded_file(uploaded_file)
+                    resume_digest = get_file_digest(uploaded_file)
+                    resume_text = extract_resume_text(resume_digest, uploaded_file)
                     
                     if resume_text is None or resume_text.strip() == "":
                         st.error("❌ Failed to extract text from the uploaded file. The file might be corrupted or empty. Please try a different file.")
@@ -221,7 +220,7 @@ else:
                         with st.spinner("🧠 Analyzing skills with NLP..."):
                             try:
                                 # Extract skills from resume
-                                resume_skills = skill_extractor.extract_skills_combined(resume_text)
+                                resume_skills = extract_resume_skills(job_skills_path, resume_digest, resume_text)
                                 
                                 # Validate extracted skills
                                 if not resume_skills:
@@ -234,24 +233,16 @@ else:
                                     if not required_skills:
                                         st.error(f"❌ No required skills found for the job role: {selected_job_role}")
                                     else:
-                                        # Perform skill gap analysis
-                                        skill_analyzer = SkillAnalyzer()
-                                        analysis_results = skill_analyzer.analyze_skill_gaps(resume_skills, required_skills)
+                                        # Perform skill gap and category analysis
+                                        analysis_results = analyze_resume_for_role(
+                                            job_skills_path, resume_digest, selected_job_role, resume_skills
+                                        )
                                         
                                         # Validate analysis results
                                         if not analysis_results:
                                             st.error("❌ Analysis failed to produce results. Please try again.")
                                         else:
-                                            # Get category analysis
-                                            skill_categories = skill_extractor.categorize_skills(list(resume_skills.keys()))
-                                            category_analysis = skill_analyzer.get_skill_category_analysis(
-                                                resume_skills, required_skills, skill_extractor.job_skills_data['technical_skills_database']
-                                            )
-                                            
                                             # Store results
-                                            analysis_results['category_analysis'] = category_analysis
-                                            analysis_results['resume_skills'] = resume_skills
-                                            analysis_results['required_skills'] = required_skills
                                             st.session_state.analysis_results = analysis_results
                                             st.session_state.analysis_complete = True
                                             
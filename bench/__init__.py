@@ -0,0 +1,3 @@
+"""
+Benchmarks for the resume analyzer (run as python -m bench.<name>)
+"""
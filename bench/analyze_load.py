@@ -0,0 +1,148 @@
+"""
+/analyze Load Test
+Drives the API's /analyze endpoint and reports latency percentiles
+
+By default requests go through the Flask test client in this process, with
+the shared, warmed engine api.server builds at import. --per-request-engine
+builds a new SkillExtractor for every request instead, as the API did before
+the engine was shared, so the two runs show the difference. --url sends the
+requests to a running server.
+
+Usage:
+    python -m bench.analyze_load -n 200 -c 4
+    python -m bench.analyze_load -n 200 -c 4 --per-request-engine
+    python -m bench.analyze_load --url http://localhost:5000 -n 500 -c 8
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_RESUME_PATH = os.path.join(REPO_ROOT, 'samples', 'sample_resume.txt')
+
+def in_process_client(per_request_engine: bool = False) -> Callable[[Dict], bool]:
+    """
+    Build a request function that calls /analyze through the Flask test client
+    
+    Args:
+        per_request_engine: Build a new skill engine for every request
+    
+    Returns:
+        Function posting one JSON payload and returning whether it succeeded
+    """
+    from api import server
+    
+    if per_request_engine:
+        from nlp_modules.skill_extractor import SkillExtractor
+        server.current_engine = lambda: SkillExtractor(server.JOB_SKILLS_PATH)
+    
+    def post(payload: Dict) -> bool:
+        response = server.app.test_client().post('/analyze', json=payload)
+        return response.status_code == 200 and response.get_json().get('success', False)
+    
+    return post
+
+def http_client(url: str) -> Callable[[Dict], bool]:
+    """
+    Build a request function that posts to /analyze on a running server
+    
+    Args:
+        url: Server base URL, e.g. http://localhost:5000
+    
+    Returns:
+        Function posting one JSON payload and returning whether it succeeded
+    """
+    endpoint = url.rstrip('/') + '/analyze'
+    
+    def post(payload: Dict) -> bool:
+        request = urllib.request.Request(endpoint, data=json.dumps(payload).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request) as response:
+            return response.status == 200 and json.load(response).get('success', False)
+    
+    return post
+
+def run_load(post: Callable[[Dict], bool], payload: Dict, requests: int, concurrency: int) -> Dict:
+    """
+    Send requests from a thread pool and summarize their latencies
+    
+    Args:
+        post: Request function from in_process_client or http_client
+        payload: JSON body of every request
+        requests: Total requests sent
+        concurrency: Requests in flight at once
+    
+    Returns:
+        Request and failure counts, throughput and p50/p90/p99/max latency in ms
+    """
+    def timed_post(_: int) -> float:
+        start = time.perf_counter()
+        ok = post(payload)
+        elapsed = time.perf_counter() - start
+        return elapsed if ok else -elapsed
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(timed_post, range(requests)))
+    wall = time.perf_counter() - start
+    
+    latencies = sorted(abs(seconds) * 1000 for seconds in results)
+    percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {
+        'requests': requests,
+        'failures': sum(seconds < 0 for seconds in results),
+        'concurrency': concurrency,
+        'requests_per_second': round(requests / wall, 1),
+        'p50_ms': round(percentiles[49], 1),
+        'p90_ms': round(percentiles[89], 1),
+        'p99_ms': round(percentiles[98], 1),
+        'max_ms': round(latencies[-1], 1)
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Load-test /analyze and print latency percentiles"""
+    parser = argparse.ArgumentParser(description='Load-test the /analyze endpoint')
+    parser.add_argument('-n', '--requests', type=int, default=200, help='Total requests (default 200)')
+    parser.add_argument('-c', '--concurrency', type=int, default=4, help='Requests in flight (default 4)')
+    parser.add_argument('--resume', default=SAMPLE_RESUME_PATH, help='Resume text file to send')
+    parser.add_argument('--role', default=None, help='Job role to analyze against (default: first role)')
+    parser.add_argument('--url', default=None, help='Base URL of a running server (default: in-process)')
+    parser.add_argument('--per-request-engine', action='store_true',
+                        help='In-process only: build a new skill engine for every request')
+    parser.add_argument('--warmup', type=int, default=5, help='Untimed requests sent first (default 5)')
+    args = parser.parse_args(argv)
+    
+    if args.requests < 2:
+        parser.error('--requests must be at least 2')
+    if args.url and args.per_request_engine:
+        parser.error('--per-request-engine only applies to in-process runs')
+    
+    with open(args.resume, 'r', encoding='utf-8') as f:
+        resume_text = f.read()
+    
+    if args.url:
+        post = http_client(args.url)
+        role = args.role
+        if role is None:
+            parser.error('--role is required with --url')
+    else:
+        post = in_process_client(args.per_request_engine)
+        from api import server
+        role = args.role or server.engine_reloader.engine.get_all_job_roles()[0]
+    
+    payload = {'resume_text': resume_text, 'job_role': role}
+    for _ in range(args.warmup):
+        post(payload)
+    
+    summary = run_load(post, payload, args.requests, args.concurrency)
+    summary['mode'] = args.url or ('per-request engine' if args.per_request_engine else 'shared engine')
+    print(json.dumps(summary, indent=2))
+
+if __name__ == '__main__':
+    main()
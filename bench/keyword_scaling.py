@@ -0,0 +1,127 @@
+"""
+Keyword Matching Scaling Benchmark
+Per-resume keyword extraction latency as the skills database grows
+
+Synthetic skills are added to a copy of job_skills.json, and
+SkillExtractor.extract_skills_keyword_based is timed against a naive scan
+that loops over every skill and variation, as extraction did before the
+compiled matcher. The naive scan is also the reference the keyword-count
+equivalence tests compare against.
+
+Usage:
+    python -m bench.keyword_scaling
+    python -m bench.keyword_scaling --extra 0 1000 5000 20000 --repeat 10 --no-naive
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOB_SKILLS_PATH = os.path.join(REPO_ROOT, 'data', 'job_skills.json')
+SAMPLE_RESUME_PATH = os.path.join(REPO_ROOT, 'samples', 'sample_resume.txt')
+
+def naive_keyword_counts(extractor, text: str) -> Dict[str, int]:
+    """
+    Count skills by scanning every skill and variation separately
+    
+    For every skill and each of its distinct variations (its lowercase name
+    and aliases), count the unigram/bigram/trigram terms containing the
+    variation plus its whole-word occurrences in the normalized text.
+    
+    Args:
+        extractor: SkillExtractor whose skills, aliases and text processor are used
+        text: Resume text
+    
+    Returns:
+        Dictionary of skills and their frequencies
+    """
+    processor = extractor.text_processor
+    normalized_text = processor.normalize_skill_terms(text.lower())
+    tokens = processor.preprocess_text(normalized_text)
+    all_terms = tokens + processor.extract_ngrams(tokens, 2) + processor.extract_ngrams(tokens, 3)
+    
+    variations = [set() for _ in extractor.skill_names]
+    for term, skill_ids in extractor.alias_index.items():
+        for skill_id in skill_ids:
+            variations[skill_id].add(term)
+    
+    skill_counts = {}
+    for skill_id, skill in enumerate(extractor.skill_names):
+        count = 0
+        for variation in variations[skill_id]:
+            count += sum(1 for term in all_terms if variation in term)
+            count += len(re.findall(r'\b' + re.escape(variation) + r'\b', normalized_text))
+        if count > 0:
+            skill_counts[skill] = count
+    
+    return skill_counts
+
+def synthetic_job_skills(path: str, extra: int, seed: int = 0) -> Dict:
+    """
+    Load a skills database and add synthetic multi-word skills to it
+    
+    Args:
+        path: job_skills.json to start from
+        extra: Number of synthetic skills to add
+        seed: Random seed for the synthetic names
+    
+    Returns:
+        Skills data with an extra 'synthetic' category
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    rng = random.Random(seed)
+    data['technical_skills_database']['synthetic'] = [
+        f"skill{i} {rng.choice(['framework', 'tool', 'lang'])}" for i in range(extra)
+    ]
+    return data
+
+def time_per_call(function: Callable[[], object], repeat: int) -> float:
+    """Mean milliseconds per call over repeat calls, after one untimed call"""
+    function()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Time keyword extraction for growing skills databases"""
+    parser = argparse.ArgumentParser(description='Time keyword extraction as the skills database grows')
+    parser.add_argument('--extra', type=int, nargs='+', default=[0, 1000, 5000],
+                        help='Synthetic skills added per run (default 0 1000 5000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed calls per measurement (default 5)')
+    parser.add_argument('--resume', default=SAMPLE_RESUME_PATH, help='Resume text file to extract from')
+    parser.add_argument('--kb', default=JOB_SKILLS_PATH, help='Skills database to start from')
+    parser.add_argument('--no-naive', action='store_true', help='Skip the naive scan')
+    args = parser.parse_args(argv)
+    
+    from nlp_modules.skill_extractor import SkillExtractor
+    
+    with open(args.resume, 'r', encoding='utf-8') as f:
+        resume_text = f.read()
+    
+    print(f"{'skills':>8} {'naive':>12} {'matcher':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for extra in args.extra:
+            path = os.path.join(directory, f'job_skills_{extra}.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(synthetic_job_skills(args.kb, extra), f)
+            extractor = SkillExtractor(path)
+            
+            matcher_ms = time_per_call(lambda: extractor.extract_skills_keyword_based(resume_text), args.repeat)
+            if args.no_naive:
+                naive = '-'
+            else:
+                naive_ms = time_per_call(lambda: naive_keyword_counts(extractor, resume_text), args.repeat)
+                naive = f'{naive_ms:.1f} ms'
+            print(f"{len(extractor.skill_names):>8} {naive:>12} {matcher_ms:>9.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Knowledge Base Hot Reload Module
+Polls the skills knowledge base file and swaps in a freshly built engine
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+class EngineReloader:
+    """
+    Holds the current engine and replaces it when its knowledge base changes
+    
+    Engines are immutable once built. A new one is built on the watcher thread
+    and published with a single reference assignment, so readers never wait:
+    a request that fetched the engine keeps using it to the end, while later
+    requests see the new one.
+    """
+    
+    def __init__(self, path: str, factory: Callable[[str], Any], interval: float = 5.0):
+        """
+        Build the initial engine
+        
+        Args:
+            path: Knowledge base file to watch (JSON or compiled artifact)
+            factory: Builds an engine from the path
+            interval: Seconds between polls of the file
+        """
+        self.path = path
+        self.factory = factory
+        self.interval = interval
+        
+        self._signature = self._stat()
+        self._digest = self._read_digest()
+        self.engine = factory(path)
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+        
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        
+        # A forked worker inherits neither the watcher thread nor a sane lock
+        # state, so both are reset in the child
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+    
+    def _reset_after_fork(self) -> None:
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+    
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """Cheap change signature of the watched file (mtime, size)"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _read_digest(self) -> Optional[str]:
+        """Content hash of the watched file, so touched but unchanged files are ignored"""
+        try:
+            with open(self.path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+    
+    def check(self) -> bool:
+        """
+        Poll the file once and swap in a new engine if its content changed
+        
+        Build errors are recorded in last_error and the current engine is kept.
+        
+        Returns:
+            True if a new engine was published
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        
+        with self._lock:
+            self._signature = signature
+            digest = self._read_digest()
+            if digest is None or digest == self._digest:
+                return False
+            
+            try:
+                engine = self.factory(self.path)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                print(f"Knowledge base reload failed, keeping the current engine: {self.last_error}")
+                return False
+            
+            self._digest = digest
+            self.engine = engine
+            self.reloads += 1
+            self.last_error = None
+            return True
+    
+    def ensure_watching(self) -> None:
+        """
+        Start the polling thread in this process if it is not running
+        
+        Threads do not survive fork, so with preloading servers this is called
+        from request handlers and starts one watcher per worker. Once running
+        it returns without locking.
+        """
+        if self.interval <= 0 or self._thread is not None:
+            return
+        
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            thread = threading.Thread(target=self._watch, name='kb-reloader', daemon=True)
+            thread.start()
+            self._thread = thread
+    
+    def stop(self) -> None:
+        """Stop the polling thread"""
+        self._stop.set()
+        with self._start_lock:
+            if self._thread is not None:
+                self._thread.join()
+            self._thread = None
+    
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,196 @@
+"""
+Compiled Knowledge Base Artifact
+Binary snapshot of the skill tables SkillExtractor builds from job_skills.json
+
+The file holds a JSON header followed by 64-byte aligned raw arrays. Arrays
+are memory-mapped read-only on load, so workers start without rebuilding the
+automaton, TF-IDF model or role matrices and share the same physical pages.
+
+Usage:
+    python -m nlp_modules.kb_artifact build [data/job_skills.json] [-o data/job_skills.kb]
+    python -m nlp_modules.kb_artifact info data/job_skills.kb
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional
+
+import numpy as np
+
+ARTIFACT_SUFFIX = '.kb'
+FORMAT_VERSION = 1
+
+_MAGIC = b'RSKB'
+_PREAMBLE = struct.Struct('<4sIQ')  # magic, format version, header length
+_ALIGNMENT = 64
+
+def is_artifact_path(path: str) -> bool:
+    """Check whether a knowledge base path names a compiled artifact"""
+    return path.endswith(ARTIFACT_SUFFIX)
+
+def default_artifact_path(source_path: str) -> str:
+    """Artifact path next to a JSON knowledge base (job_skills.json -> job_skills.kb)"""
+    return os.path.splitext(source_path)[0] + ARTIFACT_SUFFIX
+
+def source_version(source_path: str) -> str:
+    """Version hash of a JSON knowledge base, as recorded in its artifact"""
+    with open(source_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+class KnowledgeBaseArtifact:
+    """Read-only view of a compiled artifact"""
+    
+    def __init__(self, path: str):
+        """
+        Open an artifact and memory-map its arrays
+        
+        Args:
+            path: Artifact file
+        
+        Raises:
+            ValueError: If the file is not a knowledge base artifact
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self._mmap) < _PREAMBLE.size:
+            raise ValueError(f"{path} is not a knowledge base artifact")
+        magic, version, header_length = _PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a knowledge base artifact")
+        self.format_version = version
+        if version != FORMAT_VERSION:
+            self.header: Dict = {}
+            self.arrays: Dict[str, np.ndarray] = {}
+            return
+        
+        self.header = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_length])
+        self.arrays = {
+            name: np.frombuffer(
+                self._mmap, dtype=np.dtype(dtype), count=int(np.prod(shape)), offset=offset
+            ).reshape(shape)
+            for name, (offset, dtype, shape) in self.header['arrays'].items()
+        }
+    
+    @property
+    def source_path(self) -> Optional[str]:
+        """JSON knowledge base the artifact was compiled from"""
+        source = self.header.get('source')
+        if source is None:
+            return None
+        return os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(self.path)), source))
+    
+    def is_stale(self) -> bool:
+        """
+        Check whether the artifact no longer matches its source
+        
+        Returns:
+            True if the format version differs or the source JSON has changed
+            since compilation (a missing source is not considered stale)
+        """
+        if self.format_version != FORMAT_VERSION:
+            return True
+        source = self.source_path
+        if source is None or not os.path.exists(source):
+            return False
+        return source_version(source) != self.header['source_version']
+
+def write_artifact(path: str, header: Dict, arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Write an artifact atomically (readers never see a partial file)
+    
+    Args:
+        path: Artifact file
+        header: JSON-serializable metadata; an 'arrays' entry is added
+        arrays: Named arrays stored as raw little-endian data
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    
+    # Array offsets depend on the header length, so lay out with a placeholder
+    # offset width first and grow it until the header size is stable
+    layout: Dict[str, List] = {}
+    header_bytes = b''
+    while True:
+        offset = _align(_PREAMBLE.size + len(header_bytes))
+        for name, array in arrays.items():
+            layout[name] = [offset, array.dtype.str, list(array.shape)]
+            offset = _align(offset + array.nbytes)
+        encoded = json.dumps(dict(header, arrays=layout)).encode('utf-8')
+        stable = len(encoded) == len(header_bytes)
+        header_bytes = encoded
+        if stable:
+            break
+    
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREAMBLE.pack(_MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.write(b'\0' * (layout[name][0] - f.tell()))
+            f.write(array.tobytes())
+    os.replace(tmp_path, path)
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+def build(source_path: str, artifact_path: Optional[str] = None) -> str:
+    """
+    Compile a JSON knowledge base into an artifact
+    
+    Args:
+        source_path: job_skills.json file
+        artifact_path: Output file (defaults to the source path with .kb)
+    
+    Returns:
+        Path of the written artifact
+    """
+    from .skill_extractor import SkillExtractor
+    
+    artifact_path = artifact_path or default_artifact_path(source_path)
+    header, arrays = SkillExtractor(source_path).compiled_tables()
+    header['source'] = os.path.relpath(
+        os.path.abspath(source_path), os.path.dirname(os.path.abspath(artifact_path))
+    )
+    write_artifact(artifact_path, header, arrays)
+    return artifact_path
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Build or inspect a compiled knowledge base artifact"""
+    parser = argparse.ArgumentParser(description='Build or inspect a compiled knowledge base artifact')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    build_parser = subparsers.add_parser('build', help='Compile job_skills.json into an artifact')
+    build_parser.add_argument('source', nargs='?', default='data/job_skills.json')
+    build_parser.add_argument('-o', '--output', default=None, help='Artifact file')
+    
+    info_parser = subparsers.add_parser('info', help='Show artifact metadata and staleness')
+    info_parser.add_argument('artifact')
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'build':
+        path = build(args.source, args.output)
+        print(f"Wrote {path} ({os.path.getsize(path)} bytes)")
+    elif args.command == 'info':
+        artifact = KnowledgeBaseArtifact(args.artifact)
+        print(json.dumps({
+            'path': artifact.path,
+            'format_version': artifact.format_version,
+            'source': artifact.source_path,
+            'source_version': artifact.header.get('source_version'),
+            'stale': artifact.is_stale(),
+            'skills': len(artifact.header.get('skill_names', [])),
+            'aliases': len(artifact.header.get('alias_terms', [])),
+            'arrays': {
+                name: f"{dtype} {tuple(shape)}"
+                for name, (_, dtype, shape) in artifact.header.get('arrays', {}).items()
+            }
+        }, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Result Cache Module for Skill Extraction
+Thread-safe LRU cache with entry and memory caps for content-addressed results
+"""
+
+import copy
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class ResultCache:
+    """LRU cache shared by extractors, safe to use from multiple threads"""
+    
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize an empty cache
+        
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Approximate maximum memory held by cached results
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a cached result
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            A copy of the cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[0]
+        
+        return copy.copy(value)
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a result, evicting least recently used entries to stay within caps
+        
+        Args:
+            key: Cache key
+            value: Result to cache (a copy is stored)
+        """
+        value = copy.copy(value)
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            
+            self._entries[key] = (value, size)
+            self._bytes += size
+            
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop all cached results (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters and current size"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a cached result in bytes"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_estimate_size(item) for item in value)
+    return size
@@ -3,41 +3,230 @@ Skill Extraction Module for Resume Analysis
 Uses keyword-based extraction and TF-IDF for skill identification
 """
 
+import hashlib
 import json
+import os
 import re
-from typing import List, Dict, Set, Tuple
-from collections import Counter
+from collections import Counter, defaultdict
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy import sparse
 
 from .text_processor import TextProcessor
+from .skill_matcher import SkillMatcher, TokenVocabulary
+from .result_cache import ResultCache
+from .kb_artifact import KnowledgeBaseArtifact, is_artifact_path
+
+# Matches a single regex word character, used to evaluate \b around automaton hits
+_WORD_CHAR = re.compile(r'\w')
+
+# Skill-side TF-IDF settings, shared by fitting and by artifact loading
+TFIDF_PARAMS = {
+    'ngram_range': (1, 3),  # Extract unigrams, bigrams, and trigrams
+    'max_features': 1000,
+    'stop_words': 'english'
+}
 
 class SkillExtractor:
-    """Advanced skill extraction using NLP techniques"""
+    """
+    Advanced skill extraction using NLP techniques
+    
+    Everything built in the constructor (skill tables, automata, the fitted
+    TF-IDF model and the matrices) is read-only afterwards, and extraction
+    keeps its working state in locals, so one instance can be shared by many
+    threads. The only shared mutable parts, the token vocabulary and the
+    result cache, are internally locked.
+    """
     
-    def __init__(self, job_skills_path: str):
+    # Distinct tokens remembered before the token vocabulary is started afresh
+    MAX_VOCABULARY_SIZE = 200000
+    
+    def __init__(self, job_skills_path: str, result_cache: Optional[ResultCache] = None,
+                 tokenizer: str = 'regex'):
         """
         Initialize skill extractor with job skills database
         
         Args:
-            job_skills_path: Path to job_skills.json file
+            job_skills_path: Path to job_skills.json file, or to a compiled .kb
+                artifact of it (see nlp_modules.kb_artifact); a stale artifact
+                is ignored in favour of its source JSON
+            result_cache: Optional cache for combined extraction results; it may
+                be shared by several extractors and threads
+            tokenizer: Tokenizer backend for TextProcessor ('regex' or 'nltk')
         """
-        self.text_processor = TextProcessor()
-        self.job_skills_data = self._load_job_skills(job_skills_path)
+        artifact = None
+        if is_artifact_path(job_skills_path):
+            artifact = KnowledgeBaseArtifact(job_skills_path)
+            if artifact.is_stale():
+                job_skills_path = self._stale_artifact_source(artifact)
+                artifact = None
+        
+        if artifact is None:
+            self.job_skills_data, self.knowledge_base_version = self._load_job_skills(job_skills_path)
+        else:
+            self.job_skills_data = artifact.header['knowledge_base']
+            self.knowledge_base_version = artifact.header['source_version']
+        
+        self.text_processor = TextProcessor(
+            tokenizer=tokenizer,
+            normalizations=self.job_skills_data.get('skill_normalizations')
+        )
+        self.result_cache = result_cache
         self.all_skills = self._extract_all_skills()
         
-        # Initialize TF-IDF vectorizer
+        # Fixed skill order shared by every skill-indexed matrix
+        self.skill_names = sorted(self.all_skills)
+        self.skill_ids = {skill: i for i, skill in enumerate(self.skill_names)}
+        self.role_names = self.get_all_job_roles()
+        self._skill_ids_lower = {}
+        for skill_id, skill in enumerate(self.skill_names):
+            self._skill_ids_lower.setdefault(skill.lower(), skill_id)
+        self.category_names, self.skill_category_ids = self._build_category_index()
+        
+        # Automata, TF-IDF model and matrices: built from the JSON, or mapped
+        # from the artifact
+        if artifact is None:
+            self._build_tables()
+        else:
+            self._load_tables(artifact)
+        
+        self._pattern_skills = [
+            [self.skill_names[skill_id] for skill_id in self.alias_index[pattern]]
+            for pattern in self.skill_matcher.patterns
+        ]
+        
+        # Patterns without a space fit inside one token and are looked up per
+        # token id; multi-word patterns are indexed by their first word
+        self._pattern_words = [tuple(pattern.split(' ')) for pattern in self.skill_matcher.patterns]
+        self._pattern_widths = [len(words) for words in self._pattern_words]
+        self._token_pattern_ids = [
+            self.skill_matcher.pattern_ids[pattern] for pattern in self._token_matcher.patterns
+        ]
+        self._phrase_index = self._build_phrase_index()
+        self._vocabulary = TokenVocabulary(self._analyze_token)
+        
+        # Shared numeric tables are made read-only so an accidental in-place
+        # update fails instead of racing with other threads
+        for matrix in (self._pattern_skill_matrix, self.skill_tfidf_matrix,
+                       self.role_skill_matrix, self._role_unit_matrix):
+            if matrix is not None:
+                _freeze_csr(matrix)
+    
+    def _stale_artifact_source(self, artifact: KnowledgeBaseArtifact) -> str:
+        """Get the source JSON to load in place of a stale artifact"""
+        source = artifact.source_path
+        if source is None or not os.path.exists(source):
+            raise ValueError(f"Knowledge base artifact {artifact.path} is stale and its source is missing")
+        print(f"Knowledge base artifact {artifact.path} is stale, loading {source}")
+        return source
+    
+    def _build_tables(self) -> None:
+        """Compile the matching and scoring tables from the skills data"""
+        # Lowercase skill names and declared aliases -> canonical skill ids
+        self.alias_index = self._build_alias_index()
+        
+        # Compile every skill variation into one multi-pattern automaton, plus
+        # one over the single-token patterns for per-token lookups
+        self.skill_matcher = SkillMatcher(self.alias_index)
+        self._token_matcher = SkillMatcher(
+            pattern for pattern in self.skill_matcher.patterns if ' ' not in pattern
+        )
+        self._pattern_skill_matrix = self._build_pattern_skill_matrix()
+        
+        # Initialize TF-IDF vectorizer (scikit-learn is imported here rather than
+        # at module import to keep imports fast)
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        self.tfidf_vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
+        
+        # Fit the skill side once; rows are L2-normalized, so a dot product
+        # with a transformed resume vector is the cosine similarity
+        self.skill_tfidf_matrix = self._fit_skill_tfidf()
+        
+        # Roles x skills requirement matrix for scoring every role at once
+        self.role_skill_matrix, self._role_unit_matrix = self._build_role_skill_matrix()
+    
+    def _load_tables(self, artifact: KnowledgeBaseArtifact) -> None:
+        """Take the matching and scoring tables from a compiled artifact"""
+        header, arrays = artifact.header, artifact.arrays
+        
+        alias_ids = arrays['alias_skill_ids'].tolist()
+        alias_indptr = arrays['alias_skill_indptr'].tolist()
+        self.alias_index = {
+            term: tuple(alias_ids[start:end])
+            for term, start, end in zip(header['alias_terms'], alias_indptr, alias_indptr[1:])
+        }
+        
+        self.skill_matcher = SkillMatcher.from_arrays(
+            header['patterns'], _prefixed(arrays, 'matcher_')
+        )
+        self._token_matcher = SkillMatcher.from_arrays(
+            header['token_patterns'], _prefixed(arrays, 'token_matcher_')
+        )
+        self._pattern_skill_matrix = _csr_from_arrays(
+            arrays, 'pattern_skill_', (len(self.skill_matcher), len(self.skill_names))
+        )
+        
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        tfidf_terms = header['tfidf_terms']
         self.tfidf_vectorizer = TfidfVectorizer(
-            ngram_range=(1, 3),  # Extract unigrams, bigrams, and trigrams
-            max_features=1000,
-            stop_words='english'
+            vocabulary={term: i for i, term in enumerate(tfidf_terms)}, **TFIDF_PARAMS
         )
+        if tfidf_terms:
+            self.tfidf_vectorizer.idf_ = arrays['tfidf_idf']
+            self.skill_tfidf_matrix = _csr_from_arrays(
+                arrays, 'skill_tfidf_', (len(self.skill_names), len(tfidf_terms))
+            )
+        else:
+            self.skill_tfidf_matrix = None
+        
+        shape = (len(self.role_names), len(self.skill_names))
+        self.role_skill_matrix = _csr_from_arrays(arrays, 'role_skill_', shape)
+        self._role_unit_matrix = _csr_from_arrays(arrays, 'role_unit_', shape)
+    
+    def compiled_tables(self) -> Tuple[Dict, Dict[str, np.ndarray]]:
+        """
+        Export the compiled tables for nlp_modules.kb_artifact
+        
+        Returns:
+            JSON-serializable header and named arrays
+        """
+        alias_terms = list(self.alias_index)
+        alias_indptr = np.cumsum([0] + [len(self.alias_index[term]) for term in alias_terms])
+        arrays = {
+            'alias_skill_indptr': alias_indptr.astype(np.int32),
+            'alias_skill_ids': np.fromiter(
+                (skill_id for term in alias_terms for skill_id in self.alias_index[term]),
+                dtype=np.int32
+            ),
+        }
+        arrays.update(_prefixed_to(self.skill_matcher.to_arrays(), 'matcher_'))
+        arrays.update(_prefixed_to(self._token_matcher.to_arrays(), 'token_matcher_'))
+        arrays.update(_csr_to_arrays(self._pattern_skill_matrix, 'pattern_skill_'))
+        arrays.update(_csr_to_arrays(self.role_skill_matrix, 'role_skill_'))
+        arrays.update(_csr_to_arrays(self._role_unit_matrix, 'role_unit_'))
+        
+        tfidf_terms = []
+        if self.skill_tfidf_matrix is not None:
+            tfidf_terms = self.tfidf_vectorizer.get_feature_names_out().tolist()
+            arrays['tfidf_idf'] = self.tfidf_vectorizer.idf_
+            arrays.update(_csr_to_arrays(self.skill_tfidf_matrix.tocsr(), 'skill_tfidf_'))
         
-    def _load_job_skills(self, path: str) -> Dict:
-        """Load job skills database"""
-        with open(path, 'r') as f:
-            return json.load(f)
+        header = {
+            'source_version': self.knowledge_base_version,
+            'knowledge_base': self.job_skills_data,
+            'skill_names': self.skill_names,
+            'alias_terms': alias_terms,
+            'patterns': self.skill_matcher.patterns,
+            'token_patterns': self._token_matcher.patterns,
+            'tfidf_terms': tfidf_terms,
+        }
+        return header, arrays
+    
+    def _load_job_skills(self, path: str) -> Tuple[Dict, str]:
+        """Load job skills database and a version hash of its content"""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        return json.loads(raw), hashlib.sha256(raw).hexdigest()[:16]
     
     def _extract_all_skills(self) -> Set[str]:
         """Extract all unique skills from job database"""
@@ -53,6 +242,145 @@ class SkillExtractor:
         
         return all_skills
     
+    def _build_alias_index(self) -> Dict[str, Tuple[int, ...]]:
+        """
+        Build the term -> canonical skill ids lookup from the skills data file
+        
+        Every skill matches its own lowercase name plus the aliases declared
+        for it under 'skill_aliases'.
+        
+        Returns:
+            Mapping of lowercase term to the ids of the skills it stands for
+        """
+        alias_index = {}
+        
+        def add(term: str, skill_id: int) -> None:
+            term = term.strip().lower()
+            skill_ids = alias_index.get(term, ())
+            if term and skill_id not in skill_ids:
+                alias_index[term] = skill_ids + (skill_id,)
+        
+        for skill_id, skill in enumerate(self.skill_names):
+            add(skill, skill_id)
+        
+        for skill, aliases in self.job_skills_data.get('skill_aliases', {}).items():
+            if skill not in self.skill_ids:
+                raise ValueError(f"skill_aliases refers to unknown skill '{skill}'")
+            for alias in aliases:
+                add(alias, self.skill_ids[skill])
+        
+        return alias_index
+    
+    def resolve_alias(self, term: str) -> List[str]:
+        """
+        Look up the canonical skills a term is matched as
+        
+        Args:
+            term: Skill name or alias (case-insensitive)
+            
+        Returns:
+            Canonical skill names, empty if the term is unknown
+        """
+        return [self.skill_names[skill_id] for skill_id in self.alias_index.get(term.strip().lower(), ())]
+    
+    def _build_phrase_index(self) -> Dict[str, Tuple[int, ...]]:
+        """Index multi-word pattern ids by their first word"""
+        index = {}
+        for pattern_id, words in enumerate(self._pattern_words):
+            if len(words) > 1:
+                index[words[0]] = index.get(words[0], ()) + (pattern_id,)
+        return index
+    
+    def _analyze_token(self, token: str) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Compute what the vocabulary caches for a token
+        
+        Args:
+            token: Token string
+        
+        Returns:
+            Ids of the single-token patterns occurring in the token, and ids of
+            the multi-word patterns that can start in it (their first word is a
+            suffix of the token, as the rest must follow in the next tokens)
+        """
+        pattern_ids = self._token_pattern_ids
+        token_patterns = tuple(sorted({
+            pattern_ids[pattern_id]
+            for _, _, pattern_id in self._token_matcher.iter_matches(token)
+        }))
+        
+        phrase_index = self._phrase_index
+        phrase_patterns = ()
+        for offset in range(len(token) + 1):
+            candidates = phrase_index.get(token[offset:])
+            if candidates:
+                phrase_patterns += candidates
+        
+        return token_patterns, tuple(sorted(phrase_patterns))
+    
+    def _build_category_index(self) -> Tuple[List[str], List[Tuple[int, ...]]]:
+        """
+        Build the skill -> categories reverse index of technical_skills_database
+        
+        Returns:
+            Category names in database order, and for each skill id the ids of
+            the categories listing it
+        """
+        categories = self.job_skills_data['technical_skills_database']
+        skill_category_ids = [() for _ in self.skill_names]
+        for category_id, category_skills in enumerate(categories.values()):
+            for skill_id in dict.fromkeys(self.skill_ids[skill] for skill in category_skills):
+                skill_category_ids[skill_id] += (category_id,)
+        return list(categories), skill_category_ids
+    
+    def _build_pattern_skill_matrix(self) -> sparse.csr_matrix:
+        """Build the patterns x skills matrix mapping pattern counts to skill counts"""
+        rows, cols = [], []
+        for pattern_id, pattern in enumerate(self.skill_matcher.patterns):
+            for skill_id in self.alias_index[pattern]:
+                rows.append(pattern_id)
+                cols.append(skill_id)
+        
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, cols)),
+            shape=(len(self.skill_matcher), len(self.skill_names))
+        )
+    
+    def _build_role_skill_matrix(self) -> Tuple[sparse.csr_matrix, sparse.csr_matrix]:
+        """
+        Build the roles x skills requirement matrices
+        
+        Returns:
+            Count matrix (one per required skill entry, matched case-insensitively)
+            and its binary, L2-normalized counterpart used for cosine similarity
+        """
+        rows, cols = [], []
+        for role_id, role in enumerate(self.role_names):
+            for skill in self.get_job_role_skills(role):
+                rows.append(role_id)
+                cols.append(self._skill_ids_lower[skill.lower()])
+        
+        shape = (len(self.role_names), len(self.skill_names))
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=shape
+        )
+        
+        unit = counts.copy()
+        unit.data[:] = 1.0
+        norms = np.sqrt(np.asarray(unit.sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        unit = sparse.diags(1.0 / norms) @ unit
+        
+        return counts, unit.tocsr()
+    
+    def _fit_skill_tfidf(self):
+        """Fit the TF-IDF model on the skill vocabulary and return the skill matrix"""
+        try:
+            return self.tfidf_vectorizer.fit_transform(self.skill_names)
+        except ValueError as e:
+            print(f"TF-IDF model fitting failed: {e}")
+            return None
+    
     def extract_skills_keyword_based(self, text: str) -> Dict[str, int]:
         """
         Extract skills using keyword matching
@@ -63,62 +391,108 @@ class SkillExtractor:
         Returns:
             Dictionary of skills and their frequencies
         """
+        return self._skill_counts(self._count_skill_patterns(text))
+    
+    def _skill_counts(self, pattern_counts: Counter) -> Dict[str, int]:
+        """Fold pattern occurrence counts into skill frequencies"""
+        skill_counts = {}
+        for pattern_id, count in pattern_counts.items():
+            for skill in self._pattern_skills[pattern_id]:
+                skill_counts[skill] = skill_counts.get(skill, 0) + count
+        
+        return skill_counts
+    
+    def _count_skill_patterns(self, text: str) -> Counter:
+        """
+        Count skill variation occurrences in a resume
+        
+        Args:
+            text: Resume text
+            
+        Returns:
+            Counter of pattern id -> occurrence count
+        """
         # Normalize text
         normalized_text = self.text_processor.normalize_skill_terms(text.lower())
         
         # Preprocess text
         tokens = self.text_processor.preprocess_text(normalized_text)
         
-        # Create n-grams for multi-word skills
-        bigrams = self.text_processor.extract_ngrams(tokens, 2)
-        trigrams = self.text_processor.extract_ngrams(tokens, 3)
+        # Count skill variation occurrences in one automaton pass per view of the text
+        pattern_counts = Counter()
+        self._count_term_matches(tokens, pattern_counts)
+        self._count_text_matches(normalized_text, pattern_counts)
         
-        # Combine all potential skill terms
-        all_terms = tokens + bigrams + trigrams
+        return pattern_counts
+    
+    def _count_term_matches(self, tokens: List[str], pattern_counts: Counter) -> None:
+        """
+        Count, per pattern, the unigram/bigram/trigram terms containing it
         
-        # Count skill occurrences
-        skill_counts = {}
+        Tokens are mapped to integer ids whose single-token pattern hits and
+        multi-word start candidates are cached in the vocabulary, so multi-word
+        patterns are only checked at positions where one can begin. Each hit is
+        mapped to the n-gram windows (n <= 3) that cover it, so a term is
+        counted once per pattern however many times the pattern occurs inside
+        it; no n-gram strings are built.
         
-        for skill in self.all_skills:
-            skill_lower = skill.lower()
-            skill_variations = self._get_skill_variations(skill_lower)
-            
-            count = 0
-            for variation in skill_variations:
-                # Count exact matches
-                count += sum(1 for term in all_terms if variation in term)
-                
-                # Count in original text (for cases where tokenization might miss)
-                count += len(re.findall(r'\b' + re.escape(variation) + r'\b', normalized_text))
+        Args:
+            tokens: Preprocessed tokens
+            pattern_counts: Counter updated in place
+        """
+        if not tokens:
+            return
+        
+        vocabulary = self._vocabulary
+        if len(vocabulary) > self.MAX_VOCABULARY_SIZE:
+            vocabulary = self._vocabulary = TokenVocabulary(self._analyze_token)
+        token_ids = vocabulary.encode(tokens)
+        
+        # Token index of the first token of every occurrence, per pattern
+        pattern_starts = defaultdict(list)
+        token_values = vocabulary.values
+        num_tokens = len(tokens)
+        pattern_words = self._pattern_words
+        for index, token_id in enumerate(token_ids):
+            token_patterns, phrase_patterns = token_values[token_id]
+            for pattern_id in token_patterns:
+                pattern_starts[pattern_id].append(index)
             
-            if count > 0:
-                skill_counts[skill] = count
+            # Multi-word candidates are only checked where their first word
+            # ends a token: middle words must equal the following tokens and
+            # the last word must begin the token after them
+            for pattern_id in phrase_patterns:
+                words = pattern_words[pattern_id]
+                last = index + len(words) - 1
+                if last >= num_tokens or not tokens[last].startswith(words[-1]):
+                    continue
+                if all(tokens[index + i] == words[i] for i in range(1, len(words) - 1)):
+                    pattern_starts[pattern_id].append(index)
         
-        return skill_counts
+        pattern_widths = self._pattern_widths
+        for pattern_id, starts in pattern_starts.items():
+            count = _count_covering_windows(starts, pattern_widths[pattern_id], num_tokens)
+            if count:
+                pattern_counts[pattern_id] += count
     
-    def _get_skill_variations(self, skill: str) -> List[str]:
-        """Get variations of a skill term for better matching"""
-        variations = [skill]
-        
-        # Common variations
-        if 'python' in skill:
-            variations.extend(['py', 'python3'])
-        elif 'javascript' in skill:
-            variations.extend(['js', 'javascript', 'ecmascript'])
-        elif 'typescript' in skill:
-            variations.extend(['ts', 'typescript'])
-        elif 'machine learning' in skill:
-            variations.extend(['ml', 'machine learning'])
-        elif 'deep learning' in skill:
-            variations.extend(['dl', 'deep learning'])
-        elif 'react' in skill:
-            variations.extend(['reactjs', 'react.js'])
-        elif 'node' in skill:
-            variations.extend(['nodejs', 'node.js'])
-        elif 'aws' in skill:
-            variations.extend(['amazon web services', 'amazon aws'])
-        
-        return variations
+    def _count_text_matches(self, text: str, pattern_counts: Counter) -> None:
+        """
+        Count whole-word, non-overlapping occurrences of each pattern in text
+        
+        Equivalent to len(re.findall(r'\\b' + re.escape(pattern) + r'\\b', text))
+        for every pattern, in a single automaton pass.
+        
+        Args:
+            text: Normalized resume text
+            pattern_counts: Counter updated in place
+        """
+        last_end = {}
+        for start, end, pattern_id in self.skill_matcher.iter_matches(text):
+            if start < last_end.get(pattern_id, 0):
+                continue
+            if _is_word_boundary(text, start) and _is_word_boundary(text, end):
+                pattern_counts[pattern_id] += 1
+                last_end[pattern_id] = end
     
     def extract_skills_tfidf(self, text: str, top_k: int = 50) -> List[Tuple[str, float]]:
         """
@@ -131,29 +505,36 @@ class SkillExtractor:
         Returns:
             List of (skill, score) tuples
         """
-        # Prepare documents
-        documents = [text] + list(self.all_skills)
+        if self.skill_tfidf_matrix is None:
+            return []
         
-        # Fit TF-IDF
         try:
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(documents)
-            
-            # Calculate similarity between resume and each skill
-            resume_vector = tfidf_matrix[0:1]
-            skill_vectors = tfidf_matrix[1:]
-            
-            similarities = cosine_similarity(resume_vector, skill_vectors)[0]
+            similarities = self._tfidf_similarities([text])[0]
             
             # Get top skills
-            skill_scores = list(zip(self.all_skills, similarities))
-            skill_scores.sort(key=lambda x: x[1], reverse=True)
-            
-            return skill_scores[:top_k]
+            top_indices = np.argsort(-similarities, kind='stable')[:top_k]
+            return [(self.skill_names[i], float(similarities[i])) for i in top_indices]
             
         except Exception as e:
             print(f"TF-IDF extraction failed: {e}")
             return []
     
+    def _tfidf_similarities(self, texts: List[str]) -> np.ndarray:
+        """
+        Cosine similarity of each text against each skill
+        
+        Args:
+            texts: Resume texts
+            
+        Returns:
+            Dense (texts x skills) similarity array
+        """
+        # Only the resumes are transformed; the fitted model is never mutated
+        resume_matrix = self.tfidf_vectorizer.transform(texts)
+        
+        # One sparse product for the whole batch
+        return self.skill_tfidf_matrix.dot(resume_matrix.T).T.toarray()
+    
     def extract_skills_combined(self, text: str, min_frequency: int = 1) -> Dict[str, float]:
         """
         Combine keyword and TF-IDF methods for robust skill extraction
@@ -165,13 +546,77 @@ class SkillExtractor:
         Returns:
             Dictionary of skills and combined scores
         """
+        if self.result_cache is not None:
+            cache_key = self._result_cache_key(text, min_frequency, 50)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         # Keyword-based extraction
         keyword_skills = self.extract_skills_keyword_based(text)
         
         # TF-IDF extraction
         tfidf_skills = self.extract_skills_tfidf(text)
         
-        # Combine results
+        combined_skills = self._combine_scores(keyword_skills, tfidf_skills, min_frequency)
+        
+        if self.result_cache is not None:
+            self.result_cache.put(cache_key, combined_skills)
+        
+        return combined_skills
+    
+    def extract_skills_from_pages(self, pages: Iterable[str], min_frequency: int = 1) -> Dict[str, float]:
+        """
+        Combined extraction over a document that arrives page by page
+        
+        Normalization, tokenization and phrase matching run on each page as
+        it arrives (e.g. from PDFExtractor.iter_pages), so most of the work
+        overlaps with extraction. Only term windows, which may span pages, and
+        the TF-IDF scores are computed once the last page is in. The result
+        equals extract_skills_combined on the pages joined by newlines.
+        
+        Args:
+            pages: Page texts, consumed once
+            min_frequency: Minimum frequency for keyword-based extraction
+        
+        Returns:
+            Dictionary of skills and combined scores
+        """
+        text_processor = self.text_processor
+        page_texts = []
+        tokens = []
+        text_counts = Counter()
+        for page in pages:
+            page_texts.append(page)
+            normalized_page = text_processor.normalize_skill_terms(page.lower())
+            tokens.extend(text_processor.preprocess_text(normalized_page))
+            self._count_text_matches(normalized_page, text_counts)
+        
+        text = '\n'.join(page_texts)
+        if self.result_cache is not None:
+            cache_key = self._result_cache_key(text, min_frequency, 50)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Term hits are counted first, as in _count_skill_patterns, so skills
+        # come out in the same order
+        pattern_counts = Counter()
+        self._count_term_matches(tokens, pattern_counts)
+        pattern_counts.update(text_counts)
+        
+        combined_skills = self._combine_scores(
+            self._skill_counts(pattern_counts), self.extract_skills_tfidf(text), min_frequency
+        )
+        
+        if self.result_cache is not None:
+            self.result_cache.put(cache_key, combined_skills)
+        
+        return combined_skills
+    
+    def _combine_scores(self, keyword_skills: Dict[str, int], tfidf_skills: List[Tuple[str, float]],
+                        min_frequency: int) -> Dict[str, float]:
+        """Merge keyword frequencies and TF-IDF similarities into combined scores"""
         combined_skills = {}
         
         # Add keyword-based skills with frequency weighting
@@ -190,10 +635,167 @@ class SkillExtractor:
         
         return combined_skills
     
+    def _result_cache_key(self, text: str, min_frequency: int, top_k: int) -> Tuple:
+        """
+        Content-addressed cache key for a resume
+        
+        Extraction is case-insensitive, so the text is lowercased before hashing.
+        The knowledge base version makes entries from an older job_skills.json
+        unreachable as soon as the database changes, and the tokenizer name
+        keeps results from different backends apart.
+        """
+        digest = hashlib.sha256(text.lower().encode('utf-8', 'surrogatepass')).hexdigest()
+        return (self.knowledge_base_version, self.text_processor.tokenizer.name,
+                digest, min_frequency, top_k)
+    
+    def extract_skills_batch(self, texts: List[str], min_frequency: int = 1,
+                             top_k: int = 50) -> List[Dict[str, float]]:
+        """
+        Extract combined skill scores for many resumes at once
+        
+        Keyword counts are gathered into a resumes x skills matrix and the batch
+        is TF-IDF transformed in one call, so scoring is done with array
+        operations instead of per-resume Python loops.
+        
+        Args:
+            texts: Resume texts
+            min_frequency: Minimum frequency for keyword-based extraction
+            top_k: Number of top TF-IDF skills considered per resume
+            
+        Returns:
+            One dictionary of skills and combined scores per resume, equal to
+            extract_skills_combined(text, min_frequency) for each text
+        """
+        if self.result_cache is None:
+            return self._extract_skills_batch_uncached(texts, min_frequency, top_k)
+        
+        # Only resumes missing from the cache are extracted
+        cache_keys = [self._result_cache_key(text, min_frequency, top_k) for text in texts]
+        results = [self.result_cache.get(cache_key) for cache_key in cache_keys]
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            extracted = self._extract_skills_batch_uncached(
+                [texts[i] for i in missing], min_frequency, top_k
+            )
+            for i, result in zip(missing, extracted):
+                self.result_cache.put(cache_keys[i], result)
+                results[i] = result
+        
+        return results
+    
+    def _extract_skills_batch_uncached(self, texts: List[str], min_frequency: int,
+                                       top_k: int) -> List[Dict[str, float]]:
+        """Vectorized batch extraction backing extract_skills_batch"""
+        if not texts:
+            return []
+        
+        # Resumes x patterns counts, folded into resumes x skills counts
+        rows, cols, counts = [], [], []
+        pattern_orders = []
+        for row, text in enumerate(texts):
+            pattern_counts = self._count_skill_patterns(text)
+            pattern_orders.append(list(pattern_counts))
+            for pattern_id, count in pattern_counts.items():
+                rows.append(row)
+                cols.append(pattern_id)
+                counts.append(count)
+        
+        pattern_counts = sparse.csr_matrix(
+            (np.array(counts, dtype=np.int64), (rows, cols)),
+            shape=(len(texts), len(self._pattern_skills))
+        )
+        keyword_counts = (pattern_counts @ self._pattern_skill_matrix).toarray()
+        
+        # Keyword-based scores with per-resume frequency weighting
+        keyword_mask = (keyword_counts > 0) & (keyword_counts >= min_frequency)
+        max_freq = keyword_counts.max(axis=1)
+        max_freq[max_freq == 0] = 1
+        scores = np.where(keyword_mask, keyword_counts / max_freq[:, None], 0.0)
+        
+        # Top-k TF-IDF skills per resume
+        tfidf_mask = np.zeros(keyword_counts.shape, dtype=bool)
+        similarities = np.zeros(keyword_counts.shape)
+        top_indices = np.zeros((len(texts), 0), dtype=np.int64)
+        if self.skill_tfidf_matrix is not None:
+            try:
+                similarities = self._tfidf_similarities(texts)
+                top_indices = np.argsort(-similarities, axis=1, kind='stable')[:, :top_k]
+                np.put_along_axis(tfidf_mask, top_indices, True, axis=1)
+            except Exception as e:
+                print(f"TF-IDF extraction failed: {e}")
+        
+        # Boost keyword skills with TF-IDF score; TF-IDF-only skills get a lower weight
+        scores = np.where(keyword_mask & tfidf_mask,
+                          np.minimum(1.0, scores + similarities * 0.3), scores)
+        scores = np.where(~keyword_mask & tfidf_mask, similarities * 0.5, scores)
+        
+        # Keys follow extract_skills_combined's order (keyword skills as first
+        # seen in the text, then TF-IDF-only skills by rank), so cached results
+        # are identical whichever path filled the cache
+        patterns = self.skill_matcher.patterns
+        results = []
+        for i, pattern_order in enumerate(pattern_orders):
+            order = dict.fromkeys(
+                j for pattern_id in pattern_order
+                for j in self.alias_index[patterns[pattern_id]]
+                if keyword_mask[i, j]
+            )
+            order.update(dict.fromkeys(int(j) for j in top_indices[i]))
+            results.append({self.skill_names[j]: float(scores[i, j]) for j in order})
+        return results
+    
+    def rank_roles(self, resume_skills: Dict[str, float], top_k: int = 5) -> List[Dict]:
+        """
+        Score a resume against every job role and rank the best fits
+        
+        Args:
+            resume_skills: Dictionary of skills and their scores
+            top_k: Number of roles to return (all roles if None)
+            
+        Returns:
+            Role results sorted by match percentage, then similarity score
+        """
+        # Resume as indicator and weight vectors over the skill vocabulary
+        indicator = np.zeros(len(self.skill_names))
+        weights = np.zeros(len(self.skill_names))
+        weight_norm_sq = 0.0
+        for skill, score in resume_skills.items():
+            weight_norm_sq += score * score
+            skill_id = self._skill_ids_lower.get(skill.lower())
+            if skill_id is not None:
+                indicator[skill_id] = 1.0
+                weights[skill_id] = max(weights[skill_id], score)
+        
+        # Every role is scored with one matrix-vector product each
+        matched_counts = self.role_skill_matrix @ indicator
+        similarities = self._role_unit_matrix @ weights
+        if weight_norm_sq > 0:
+            similarities /= np.sqrt(weight_norm_sq)
+        
+        required_counts = np.asarray(self.role_skill_matrix.sum(axis=1)).ravel()
+        
+        ranking = []
+        for role_id, role in enumerate(self.role_names):
+            required = int(required_counts[role_id])
+            matched = int(matched_counts[role_id])
+            match_percentage = round(matched / required * 100, 2) if required else 0.0
+            ranking.append({
+                'job_role': role,
+                'match_percentage': match_percentage,
+                'similarity_score': float(similarities[role_id]),
+                'total_required_skills': required,
+                'total_matched_skills': matched
+            })
+        
+        ranking.sort(key=lambda r: (r['match_percentage'], r['similarity_score']), reverse=True)
+        return ranking[:top_k] if top_k is not None else ranking
+    
     def get_job_role_skills(self, job_role: str) -> List[str]:
         """Get required skills for a specific job role"""
         if job_role in self.job_skills_data['job_roles']:
-            return self.job_skills_data['job_roles'][job_role]['required_skills']
+            # A copy, so callers cannot alter the shared knowledge base
+            return list(self.job_skills_data['job_roles'][job_role]['required_skills'])
         return []
     
     def get_job_role_description(self, job_role: str) -> str:
@@ -216,12 +818,72 @@ class SkillExtractor:
         Returns:
             Dictionary of categories and their skills
         """
-        categorized = {}
-        
-        for category, category_skills in self.job_skills_data['technical_skills_database'].items():
-            category_name = category.replace('_', ' ').title()
-            matched_skills = [skill for skill in skills if skill in category_skills]
-            if matched_skills:
-                categorized[category_name] = matched_skills
+        # One pass over the skills through the reverse index; each category
+        # keeps the order (and repeats) of the input skills
+        category_skills = {}
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is None:
+                continue
+            for category_id in self.skill_category_ids[skill_id]:
+                category_skills.setdefault(category_id, []).append(skill)
         
-        return categorized
+        return {
+            self.category_names[category_id].replace('_', ' ').title(): category_skills[category_id]
+            for category_id in sorted(category_skills)
+        }
+
+def _prefixed(arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, np.ndarray]:
+    """Select the arrays stored under a name prefix, with the prefix removed"""
+    return {name[len(prefix):]: array for name, array in arrays.items() if name.startswith(prefix)}
+
+def _prefixed_to(arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, np.ndarray]:
+    """Store arrays under a name prefix"""
+    return {prefix + name: array for name, array in arrays.items()}
+
+def _csr_to_arrays(matrix: sparse.csr_matrix, prefix: str) -> Dict[str, np.ndarray]:
+    """Split a CSR matrix into its data, indices and indptr arrays"""
+    return {prefix + 'data': matrix.data, prefix + 'indices': matrix.indices, prefix + 'indptr': matrix.indptr}
+
+def _csr_from_arrays(arrays: Dict[str, np.ndarray], prefix: str, shape: Tuple[int, int]) -> sparse.csr_matrix:
+    """Rebuild a CSR matrix over (memory-mapped) arrays without copying them"""
+    return sparse.csr_matrix(
+        (arrays[prefix + 'data'], arrays[prefix + 'indices'], arrays[prefix + 'indptr']),
+        shape=shape, copy=False
+    )
+
+def _freeze_csr(matrix: sparse.csr_matrix) -> None:
+    """Mark the arrays of a CSR matrix read-only"""
+    for array in (matrix.data, matrix.indices, matrix.indptr):
+        array.flags.writeable = False
+
+def _count_covering_windows(starts: List[int], width: int, num_tokens: int) -> int:
+    """
+    Count the distinct n-gram windows (n <= 3) covering at least one occurrence
+    
+    Args:
+        starts: Ascending first-token indexes of the occurrences
+        width: Number of tokens each occurrence spans
+        num_tokens: Number of tokens in the text
+    
+    Returns:
+        Number of distinct (window start, n) pairs
+    """
+    count = 0
+    for n in range(width, 4):
+        # Window starts covering an occurrence at first form one interval
+        # per occurrence, ascending with first, so overlaps merge in one pass
+        covered = -1
+        for first in starts:
+            low = max(0, first + width - n, covered + 1)
+            high = min(first, num_tokens - n)
+            if high >= low:
+                count += high - low + 1
+                covered = high
+    return count
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Evaluate the regex \\b assertion at index in text"""
+    before = index > 0 and _WORD_CHAR.match(text[index - 1]) is not None
+    after = index < len(text) and _WORD_CHAR.match(text[index]) is not None
+    return before != after
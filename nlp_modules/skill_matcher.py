@@ -0,0 +1,218 @@
+"""
+Multi-Pattern Skill Matching Module
+Aho-Corasick automaton that finds every skill term in a single pass over the text
+"""
+
+import threading
+from array import array
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+class SkillMatcher:
+    """Aho-Corasick automaton built once over a fixed set of skill patterns"""
+    
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Build the automaton
+        
+        Args:
+            patterns: Pattern strings to match (duplicates are stored once)
+        """
+        self.patterns: List[str] = []
+        self.pattern_ids: Dict[str, int] = {}
+        
+        # Trie transitions, failure links and the pattern ids ending at each state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        
+        for pattern in patterns:
+            self._add_pattern(pattern)
+        self._build_failure_links()
+    
+    def _add_pattern(self, pattern: str) -> None:
+        """Insert a pattern into the trie"""
+        if not pattern or pattern in self.pattern_ids:
+            return
+        
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        self.pattern_ids[pattern] = pattern_id
+        self._output[state] = self._output[state] + (pattern_id,)
+    
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self._goto[0].values())
+        
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                
+                self._fail[next_state] = target
+                if self._output[target]:
+                    self._output[next_state] = self._output[next_state] + self._output[target]
+    
+    def __len__(self) -> int:
+        return len(self.patterns)
+    
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Flatten the automaton tables into arrays for a compiled artifact
+        
+        Returns:
+            Transition (CSR by state), failure link and output arrays
+        """
+        goto_indptr = [0]
+        goto_chars, goto_targets = [], []
+        for transitions in self._goto:
+            goto_chars.extend(ord(char) for char in transitions)
+            goto_targets.extend(transitions.values())
+            goto_indptr.append(len(goto_chars))
+        
+        output_indptr = [0]
+        output_ids = []
+        for pattern_ids in self._output:
+            output_ids.extend(pattern_ids)
+            output_indptr.append(len(output_ids))
+        
+        return {
+            'goto_indptr': np.asarray(goto_indptr, dtype=np.int32),
+            'goto_chars': np.asarray(goto_chars, dtype=np.uint32),
+            'goto_targets': np.asarray(goto_targets, dtype=np.int32),
+            'fail': np.asarray(self._fail, dtype=np.int32),
+            'output_indptr': np.asarray(output_indptr, dtype=np.int32),
+            'output_ids': np.asarray(output_ids, dtype=np.int32),
+        }
+    
+    @classmethod
+    def from_arrays(cls, patterns: List[str], arrays: Dict[str, np.ndarray]) -> 'SkillMatcher':
+        """
+        Rebuild an automaton from to_arrays output without recomputing failure links
+        
+        Args:
+            patterns: Pattern strings in pattern id order
+            arrays: Tables produced by to_arrays
+        
+        Returns:
+            Matcher equivalent to the one the arrays were taken from
+        """
+        matcher = cls.__new__(cls)
+        matcher.patterns = list(patterns)
+        matcher.pattern_ids = {pattern: i for i, pattern in enumerate(matcher.patterns)}
+        
+        goto_indptr = arrays['goto_indptr'].tolist()
+        goto_chars = [chr(char) for char in arrays['goto_chars'].tolist()]
+        goto_targets = arrays['goto_targets'].tolist()
+        matcher._goto = [
+            dict(zip(goto_chars[start:end], goto_targets[start:end]))
+            for start, end in zip(goto_indptr, goto_indptr[1:])
+        ]
+        matcher._fail = arrays['fail'].tolist()
+        
+        output_indptr = arrays['output_indptr'].tolist()
+        output_ids = arrays['output_ids'].tolist()
+        matcher._output = [
+            tuple(output_ids[start:end])
+            for start, end in zip(output_indptr, output_indptr[1:])
+        ]
+        return matcher
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Find every (possibly overlapping) pattern occurrence in text
+        
+        Args:
+            text: Text to scan
+        
+        Yields:
+            (start, end, pattern_id) tuples, ordered by end offset
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        patterns = self.patterns
+        
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            
+            if output[state]:
+                end = index + 1
+                for pattern_id in output[state]:
+                    yield end - len(patterns[pattern_id]), end, pattern_id
+
+class TokenVocabulary:
+    """
+    Token string -> integer id table with per-token analysis cached by id
+    
+    Resumes share most of their vocabulary, so whatever is derived from a
+    token string (such as the skill patterns it contains) is computed the
+    first time the token is seen and then looked up by id.
+    """
+    
+    def __init__(self, analyze: Callable[[str], Any]):
+        """
+        Initialize an empty vocabulary
+        
+        Args:
+            analyze: Function computing the cached value for a new token
+        """
+        self.analyze = analyze
+        self.token_ids: Dict[str, int] = {}
+        self.tokens: List[str] = []
+        self.values: List[Any] = []
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.tokens)
+    
+    def encode(self, tokens: Sequence[str]) -> array:
+        """
+        Map tokens to ids, adding unseen tokens
+        
+        Args:
+            tokens: Token strings
+        
+        Returns:
+            array('I') of token ids
+        """
+        token_ids = self.token_ids
+        return array('I', [
+            token_ids[token] if token in token_ids else self._add(token)
+            for token in tokens
+        ])
+    
+    def _add(self, token: str) -> int:
+        """Assign the next id to a token and cache its analysis"""
+        value = self.analyze(token)
+        with self._lock:
+            token_id = self.token_ids.get(token)
+            if token_id is None:
+                # values is appended before the id is published, so readers
+                # never see an id without its value
+                token_id = len(self.tokens)
+                self.tokens.append(token)
+                self.values.append(value)
+                self.token_ids[token] = token_id
+        return token_id
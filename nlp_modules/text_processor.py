@@ -3,29 +3,197 @@ Text Processing Module for Resume Skill Extraction
 Handles tokenization, stopword removal, and text preprocessing
 """
 
+import os
 import re
 import string
-from typing import List, Set
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-
-# Download required NLTK data (only once)
-# punkt_tab is required by newer NLTK versions for word_tokenize/sent_tokenize
-for resource in ('punkt', 'punkt_tab', 'stopwords'):
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from .stopwords import ENGLISH_STOPWORDS
+
+# Strict offline mode: never download NLTK data, use the bundled fallbacks instead
+OFFLINE = os.environ.get('RESUME_ANALYZER_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+# Common skill term variations, applied as whole words to lowercased text
+DEFAULT_SKILL_NORMALIZATIONS = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'ml': 'machine learning',
+    'dl': 'deep learning',
+    'nlp': 'natural language processing',
+    'cv': 'computer vision',
+    'ai': 'artificial intelligence',
+    'ci/cd': 'ci/cd',
+    'devops': 'devops',
+    'ui/ux': 'ui ux',
+    'fullstack': 'full stack',
+    'full-stack': 'full stack',
+    'back end': 'backend',
+    'back-end': 'backend',
+    'front end': 'frontend',
+    'front-end': 'frontend',
+}
+
+# Characters clean_text keeps besides word characters and whitespace
+_KEPT_PUNCTUATION = frozenset('-.+#/')
+_WORD_CHAR = re.compile(r'\w')
+
+class _CleanTextTable(dict):
+    """
+    str.translate table mapping every character clean_text removes to a space
+    
+    Unicode is too large to enumerate, so entries are filled in on first
+    sight of each code point and then served by plain dict lookup.
+    """
+    
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        keep = _WORD_CHAR.match(char) or char.isspace() or char in _KEPT_PUNCTUATION
+        value = codepoint if keep else 32
+        self[codepoint] = value
+        return value
+
+_CLEAN_TEXT_TABLE = _CleanTextTable()
+
+# Whether NLTK's punkt sentence model is usable, resolved on first use
+_punkt_available: Optional[bool] = None
+_punkt_download_attempted = False
+
+def _punkt_installed() -> bool:
+    """Check whether punkt data can be loaded from the local NLTK data path"""
+    from nltk.tokenize import sent_tokenize
     try:
-        if resource == 'stopwords':
-            nltk.data.find('corpora/stopwords')
-        else:
-            nltk.data.find(f'tokenizers/{resource}')
+        sent_tokenize('Ready.')
+        return True
     except LookupError:
-        nltk.download(resource, quiet=True)
+        return False
+
+def _punkt_ready(offline: bool) -> bool:
+    """
+    Check whether NLTK sentence tokenization can be used, downloading punkt
+    at most once per process and never when offline
+    
+    Args:
+        offline: Never touch the network
+        
+    Returns:
+        True if punkt is available
+    """
+    global _punkt_available, _punkt_download_attempted
+    if _punkt_available is None:
+        _punkt_available = _punkt_installed()
+    
+    if not _punkt_available and not offline and not _punkt_download_attempted:
+        import nltk
+        _punkt_download_attempted = True
+        # punkt_tab is required by newer NLTK versions, punkt by older ones
+        for resource in ('punkt_tab', 'punkt'):
+            nltk.download(resource, quiet=True)
+        _punkt_available = _punkt_installed()
+    
+    return _punkt_available
+
+def compile_term_alternation(terms: Iterable[str]) -> str:
+    """
+    Build a regex alternation of literal terms, factored into a prefix trie
+    
+    Python's re tries the branches of a flat alternation one by one, so
+    matching cost grows with the number of terms. Factoring shared prefixes
+    keeps each match attempt proportional to term length instead. Longer
+    terms are preferred over their prefixes, with backtracking to a shorter
+    term when a longer one does not fit.
+    
+    Args:
+        terms: Literal terms (empty strings are ignored)
+        
+    Returns:
+        Regex source for a non-capturing group matching any of the terms
+    """
+    trie: Dict = {}
+    for term in terms:
+        if not term:
+            continue
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return '(?:' + body + ')?' if len(branches) == 1 else body + '?'
+        return body
+    
+    if not trie:
+        return '(?!)'
+    return '(?:' + build(trie) + ')'
+
+class Tokenizer:
+    """Tokenizer strategy interface used by TextProcessor"""
+    
+    name = 'base'
+    
+    def tokenize(self, text: str) -> List[str]:
+        """Split cleaned text into tokens"""
+        raise NotImplementedError
+
+class RegexTokenizer(Tokenizer):
+    """Single compiled-regex tokenizer for short technical documents"""
+    
+    name = 'regex'
+    
+    # A word may carry trailing '+'/'#' and be joined by '.', '/' or '-' to
+    # further words, so c++, c#, .net, node.js, ci/cd and full-stack stay whole
+    # while sentence-final periods and stray punctuation are dropped
+    TOKEN_PATTERN = re.compile(r'\.?\w[\w+#]*(?:[./\-]\w[\w+#]*)*')
+    
+    def tokenize(self, text: str) -> List[str]:
+        return self.TOKEN_PATTERN.findall(text)
+
+class NLTKTokenizer(Tokenizer):
+    """NLTK word_tokenize backend (punkt sentence split plus Treebank rules)"""
+    
+    name = 'nltk'
+    
+    def __init__(self, offline: bool = OFFLINE):
+        self.offline = offline
+    
+    def tokenize(self, text: str) -> List[str]:
+        from nltk.tokenize import word_tokenize
+        
+        # Without punkt, tokenize the text as a single line (no sentence split)
+        return word_tokenize(text, preserve_line=not _punkt_ready(self.offline))
+
+TOKENIZERS = {
+    RegexTokenizer.name: RegexTokenizer,
+    NLTKTokenizer.name: NLTKTokenizer,
+}
 
 class TextProcessor:
     """Advanced text processing for resume analysis"""
     
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, offline: Optional[bool] = None,
+                 tokenizer: Union[str, Tokenizer] = 'regex',
+                 normalizations: Optional[Dict[str, str]] = None):
+        """
+        Initialize text processor
+        
+        Args:
+            offline: Never download NLTK data (defaults to RESUME_ANALYZER_OFFLINE)
+            tokenizer: Tokenizer backend name ('regex' or 'nltk') or instance
+            normalizations: Extra or overriding term -> replacement entries for
+                normalize_skill_terms, on top of DEFAULT_SKILL_NORMALIZATIONS
+        """
+        self.offline = OFFLINE if offline is None else offline
+        if isinstance(tokenizer, str):
+            if tokenizer not in TOKENIZERS:
+                raise ValueError(f"Unknown tokenizer '{tokenizer}', expected one of {sorted(TOKENIZERS)}")
+            tokenizer = NLTKTokenizer(self.offline) if tokenizer == 'nltk' else TOKENIZERS[tokenizer]()
+        self.tokenizer = tokenizer
+        stop_words = set(ENGLISH_STOPWORDS)
         # Add custom stopwords relevant to resumes
         custom_stopwords = {
             'experience', 'work', 'project', 'projects', 'team', 'teams',
@@ -37,7 +205,16 @@ class TextProcessor:
             'different', 'various', 'etc', 'also', 'well', 'good', 'excellent',
             'strong', 'solid', 'deep', 'extensive', 'hands', 'on', 'hand'
         }
-        self.stop_words.update(custom_stopwords)
+        stop_words.update(custom_stopwords)
+        self.stop_words = frozenset(stop_words)
+        
+        # Normalization table compiled once into a single alternation
+        self.normalizations = dict(DEFAULT_SKILL_NORMALIZATIONS)
+        for term, replacement in (normalizations or {}).items():
+            self.normalizations[term.lower()] = replacement.lower()
+        self._normalization_pattern = re.compile(
+            r'\b' + compile_term_alternation(self.normalizations) + r'\b'
+        )
         
     def clean_text(self, text: str) -> str:
         """
@@ -50,15 +227,13 @@ class TextProcessor:
             Cleaned text
         """
         # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\-\.\+\#\/]', ' ', text)
+        text = text.translate(_CLEAN_TEXT_TABLE)
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove extra whitespace (split() also drops leading/trailing space)
+        text = ' '.join(text.split())
         
         # Convert to lowercase
-        text = text.lower().strip()
-        
-        return text
+        return text.lower()
     
     def tokenize(self, text: str) -> List[str]:
         """
@@ -70,7 +245,7 @@ class TextProcessor:
         Returns:
             List of tokens
         """
-        tokens = word_tokenize(text)
+        tokens = self.tokenizer.tokenize(text)
         return tokens
     
     def remove_stopwords(self, tokens: List[str]) -> List[str]:
@@ -100,7 +275,11 @@ class TextProcessor:
         Returns:
             List of sentences
         """
-        sentences = sent_tokenize(text)
+        if _punkt_ready(self.offline):
+            from nltk.tokenize import sent_tokenize
+            sentences = sent_tokenize(text)
+        else:
+            sentences = re.split(r'(?<=[.!?])\s+', text)
         return [sent.strip() for sent in sentences if sent.strip()]
     
     def preprocess_text(self, text: str) -> List[str]:
@@ -113,16 +292,13 @@ class TextProcessor:
         Returns:
             Processed tokens
         """
-        # Clean text
-        cleaned_text = self.clean_text(text)
-        
-        # Tokenize
-        tokens = self.tokenize(cleaned_text)
-        
-        # Remove stopwords
-        filtered_tokens = self.remove_stopwords(tokens)
-        
-        return filtered_tokens
+        # Cleaned text is already lowercase, so stopwords are filtered without
+        # re-lowering each token
+        stop_words = self.stop_words
+        return [
+            token for token in self.tokenize(self.clean_text(text))
+            if len(token) > 1 and token not in stop_words
+        ]
     
     def extract_ngrams(self, tokens: List[str], n: int = 2) -> List[str]:
         """
@@ -151,29 +327,8 @@ class TextProcessor:
         Returns:
             Normalized text
         """
-        # Common skill term variations
-        normalizations = {
-            'js': 'javascript',
-            'ts': 'typescript',
-            'py': 'python',
-            'ml': 'machine learning',
-            'dl': 'deep learning',
-            'nlp': 'natural language processing',
-            'cv': 'computer vision',
-            'ai': 'artificial intelligence',
-            'ci/cd': 'ci/cd',
-            'devops': 'devops',
-            'ui/ux': 'ui ux',
-            'fullstack': 'full stack',
-            'full-stack': 'full stack',
-            'back end': 'backend',
-            'back-end': 'backend',
-            'front end': 'frontend',
-            'front-end': 'frontend',
-        }
-        
-        normalized_text = text.lower()
-        for old, new in normalizations.items():
-            normalized_text = re.sub(r'\b' + re.escape(old) + r'\b', new, normalized_text)
-        
-        return normalized_text
+        # One pass over the text; each hit is replaced by dict lookup
+        return self._normalization_pattern.sub(self._replace_normalized_term, text.lower())
+    
+    def _replace_normalized_term(self, match: re.Match) -> str:
+        return self.normalizations[match.group(0)]
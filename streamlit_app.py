@@ -18,10 +18,8 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.join(current_dir, 'nlp_modules'))
 sys.path.append(os.path.join(current_dir, 'utils'))
 
-from nlp_modules.skill_extractor import SkillExtractor
-from utils.pdf_extractor import PDFExtractor
-from utils.skill_analyzer import SkillAnalyzer
 from utils.shared import set_custom_css, create_progress_ring, create_skill_bar_chart, create_skill_radar_chart, display_skill_cards
+from utils.shared import load_skill_extractor, get_file_digest, extract_resume_text, extract_resume_skills, analyze_resume_for_role
 
 # Page configuration with wide layout and no auth redirects
 st.set_page_config(
@@ -257,7 +255,7 @@ else:
         job_skills_path = os.path.join(current_dir, 'data', 'job_skills.json')
         
         try:
-            skill_extractor = SkillExtractor(job_skills_path)
+            skill_extractor = load_skill_extractor(job_skills_path)
             job_roles = skill_extractor.get_all_job_roles()
             selected_job_role = st.selectbox(
                 "Choose your target role",
@@ -302,7 +300,8 @@ else:
             else:
                 # Extract text from uploaded file
                 with st.spinner("📄 Extracting text from resume..."):
-                    resume_text = PDFExtractor.extract_text_from_uploaded_file(uploaded_file)
+                    resume_digest = get_file_digest(uploaded_file)
+                    resume_text = extract_resume_text(resume_digest, uploaded_file)
                     
                     if resume_text is None or resume_text.strip() == "":
                         st.error("❌ Failed to extract text from the uploaded file. The file might be corrupted or empty. Please try a different file.")
@@ -316,7 +315,7 @@ else:
                         with st.spinner("🧠 Analyzing skills with NLP..."):
                             try:
                                 # Extract skills from resume
-                                resume_skills = skill_extractor.extract_skills_combined(resume_text)
+                                resume_skills = extract_resume_skills(job_skills_path, resume_digest, resume_text)
                                 
                                 # Validate extracted skills
                                 if not resume_skills:
@@ -329,24 +328,16 @@ else:
                                     if not required_skills:
                                         st.error(f"❌ No required skills found for the job role: {selected_job_role}")
                                     else:
-                                        # Perform skill gap analysis
-                                        skill_analyzer = SkillAnalyzer()
-                                        analysis_results = skill_analyzer.analyze_skill_gaps(resume_skills, required_skills)
+                                        # Perform skill gap and category analysis
+                                        analysis_results = analyze_resume_for_role(
+                                            job_skills_path, resume_digest, selected_job_role, resume_skills
+                                        )
                                         
                                         # Validate analysis results
                                         if not analysis_results:
                                             st.error("❌ Analysis failed to produce results. Please try again.")
                                         else:
-                                            # Get category analysis
-                                            skill_categories = skill_extractor.categorize_skills(list(resume_skills.keys()))
-                                            category_analysis = skill_analyzer.get_skill_category_analysis(
-                                                resume_skills, required_skills, skill_extractor.job_skills_data['technical_skills_database']
-                                            )
-
                                             # Store results
-                                            analysis_results['category_analysis'] = category_analysis
-                                            analysis_results['resume_skills'] = resume_skills
-                                            analysis_results['required_skills'] = required_skills
                                             st.session_state.analysis_results = analysis_results
                                             st.session_state.analysis_complete = True
 
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the resume analyzer test suite
+"""
+
+import os
+import sys
+
+import pytest
+
+# Tests never download NLTK data; the default regex tokenizer needs none
+os.environ.setdefault('RESUME_ANALYZER_OFFLINE', '1')
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+JOB_SKILLS_PATH = os.path.join(REPO_ROOT, 'data', 'job_skills.json')
+SAMPLE_RESUME_PATH = os.path.join(REPO_ROOT, 'samples', 'sample_resume.txt')
+
+@pytest.fixture(scope='session')
+def skill_extractor():
+    """One SkillExtractor over the bundled skills data, shared by all tests"""
+    from nlp_modules.skill_extractor import SkillExtractor
+    return SkillExtractor(JOB_SKILLS_PATH)
+
+@pytest.fixture(scope='session')
+def sample_resume():
+    """Text of the bundled sample resume"""
+    with open(SAMPLE_RESUME_PATH, 'r', encoding='utf-8') as f:
+        return f.read()
@@ -0,0 +1,102 @@
+"""
+Restart and merge tests for the bulk resume analysis CLI
+"""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from conftest import JOB_SKILLS_PATH
+
+def write_corpus(directory, sample_resume, count=8):
+    """Write numbered text resumes and return their paths in order"""
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f'r{i:02d}.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'Resume {i}\n{sample_resume}')
+        paths.append(path)
+    return paths
+
+def read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='the crashing worker is patched in by forking')
+def test_worker_death_restart_and_merge(tmp_path, sample_resume, skill_extractor, monkeypatch):
+    from utils import bulk_analyzer
+    
+    paths = write_corpus(str(tmp_path), sample_resume)
+    crashing = paths[3]
+    roles = skill_extractor.get_all_job_roles()[:1]
+    output_path = str(tmp_path / 'out.jsonl')
+    checkpoint_path = str(tmp_path / 'progress.sqlite3')
+    
+    analyze_file = bulk_analyzer.BulkEngine.analyze_file
+    
+    def analyze_or_die(self, path):
+        if path == crashing:
+            os._exit(1)
+        return analyze_file(self, path)
+    
+    # First run: the worker handling one resume dies, failing it and
+    # whatever else was in flight
+    monkeypatch.setattr(bulk_analyzer.BulkEngine, 'analyze_file', analyze_or_die)
+    checkpoint = bulk_analyzer.BulkCheckpoint(checkpoint_path)
+    with open(output_path, 'w', encoding='utf-8') as output:
+        summary = bulk_analyzer.run(paths, JOB_SKILLS_PATH, roles, output, jobs=2, checkpoint=checkpoint)
+    checkpoint.close()
+    first_run = read_records(output_path)
+    assert [record['path'] for record in first_run] == paths
+    failed = {record['path'] for record in first_run if 'digest' not in record}
+    assert crashing in failed
+    assert all(record['error'].startswith('worker: BrokenProcessPool') for record in first_run
+               if record['path'] in failed)
+    assert summary['errors'] == len(failed)
+    
+    # Restart: only the failed resumes are retried, and now succeed
+    monkeypatch.undo()
+    checkpoint = bulk_analyzer.BulkCheckpoint(checkpoint_path)
+    with open(output_path, 'a', encoding='utf-8') as output:
+        summary = bulk_analyzer.run(paths, JOB_SKILLS_PATH, roles, output, jobs=1, checkpoint=checkpoint)
+    checkpoint.close()
+    assert summary['skipped'] == len(paths) - len(failed)
+    assert summary['documents'] == len(failed)
+    assert summary['errors'] == 0
+    
+    merged_path = str(tmp_path / 'merged.jsonl')
+    with open(merged_path, 'w', encoding='utf-8') as merged:
+        counts = bulk_analyzer.merge([output_path], merged)
+    assert counts == {'written': len(paths), 'duplicates': len(failed), 'malformed': 0}
+    
+    records = read_records(merged_path)
+    assert sorted(record['path'] for record in records) == paths
+    assert not any('error' in record for record in records)
+
+def test_merge_keeps_unretried_errors_once(tmp_path):
+    from utils import bulk_analyzer
+    
+    first = tmp_path / 'first.jsonl'
+    second = tmp_path / 'second.jsonl'
+    first.write_text('\n'.join(json.dumps(record) for record in [
+        {'path': 'r/a.pdf', 'error': 'worker: BrokenProcessPool: died'},
+        {'path': 'r/b.pdf', 'error': 'read: FileNotFoundError: gone'},
+        {'path': 'r/c.pdf', 'digest': 'c1', 'skills': {}},
+    ]) + '\n{"path": "r/d.p')
+    second.write_text('\n'.join(json.dumps(record) for record in [
+        {'path': 'r/b.pdf', 'error': 'read: FileNotFoundError: gone'},
+        {'path': 'r/a.pdf', 'digest': 'abc', 'skills': {}},
+        {'path': 'r/c.pdf', 'digest': 'c1', 'skills': {}},
+    ]) + '\n')
+    
+    merged = tmp_path / 'merged.jsonl'
+    with open(merged, 'w', encoding='utf-8') as output:
+        counts = bulk_analyzer.merge([str(first), str(second)], output)
+    
+    assert counts == {'written': 3, 'duplicates': 3, 'malformed': 1}
+    assert [(record['path'], record.get('digest')) for record in read_records(merged)] == [
+        ('r/b.pdf', None), ('r/c.pdf', 'c1'), ('r/a.pdf', 'abc')
+    ]
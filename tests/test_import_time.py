@@ -0,0 +1,39 @@
+"""
+Import-time budget for the skill extraction module
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from conftest import REPO_ROOT
+
+# Generous against the ~0.2 s measured locally, well under the ~1.3 s eager import
+IMPORT_BUDGET_SECONDS = 0.8
+ATTEMPTS = 3
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import nlp_modules.skill_extractor
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'modules': [m for m in ('nltk', 'sklearn') if m in sys.modules]}))
+"""
+
+def time_import():
+    """Import the module in a fresh interpreter and report time and heavy modules loaded"""
+    env = dict(os.environ, RESUME_ANALYZER_OFFLINE='1')
+    output = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT], cwd=REPO_ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def test_import_is_fast_and_lazy():
+    results = [time_import() for _ in range(ATTEMPTS)]
+    
+    # Heavy libraries are loaded when an extractor is built, not at import
+    assert results[0]['modules'] == []
+    
+    # Best of a few runs, so one slow cold start does not fail the check
+    best = min(result['elapsed'] for result in results)
+    assert best < IMPORT_BUDGET_SECONDS, f"import took {best:.2f}s, budget {IMPORT_BUDGET_SECONDS}s"
@@ -0,0 +1,46 @@
+"""
+Equivalence tests pinning the keyword-count semantics of SkillExtractor
+"""
+
+import random
+
+import pytest
+
+from bench.keyword_scaling import naive_keyword_counts
+
+# Tokens that exercise punctuation, short aliases and word boundaries
+TRICKY_TOKENS = ['c++', 'c#', '.net', 'node.js', 'js', 'ml', 'a/b', 'py', 'Hello.', 'end.']
+
+def random_texts(extractor, sample_resume, count=30, seed=7):
+    """Seeded random texts mixing resume words, skill names and tricky tokens"""
+    rng = random.Random(seed)
+    words = sample_resume.split() + extractor.skill_names + TRICKY_TOKENS
+    return [' '.join(rng.choice(words) for _ in range(rng.randint(1, 300))) for _ in range(count)]
+
+def test_sample_resume_matches_reference(skill_extractor, sample_resume):
+    expected = naive_keyword_counts(skill_extractor, sample_resume)
+    assert expected
+    assert skill_extractor.extract_skills_keyword_based(sample_resume) == expected
+
+def test_empty_text_has_no_skills(skill_extractor):
+    assert skill_extractor.extract_skills_keyword_based('') == {}
+
+def test_random_texts_match_reference(skill_extractor, sample_resume):
+    for text in random_texts(skill_extractor, sample_resume):
+        assert skill_extractor.extract_skills_keyword_based(text) == naive_keyword_counts(skill_extractor, text), text
+
+def test_variations_are_counted_once(skill_extractor):
+    # A skill whose name is also listed among its variations used to be
+    # counted twice; each distinct term now counts once per occurrence
+    assert skill_extractor.extract_skills_keyword_based('javascript')['JavaScript'] == 2
+    assert skill_extractor.extract_skills_keyword_based('nodejs')['Node.js'] == 2
+
+@pytest.mark.parametrize('term, skills', [
+    ('py', ['Python']),
+    ('JS', ['JavaScript']),
+    ('amazon web services', ['AWS']),
+    ('nodejs', ['Node.js']),
+    ('not a skill', []),
+])
+def test_resolve_alias(skill_extractor, term, skills):
+    assert skill_extractor.resolve_alias(term) == skills
@@ -0,0 +1,70 @@
+"""
+Concurrency tests for sharing one SkillExtractor and SkillAnalyzer across threads
+"""
+
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import JOB_SKILLS_PATH
+
+NUM_THREADS = 16
+NUM_CALLS = 120
+
+@pytest.fixture
+def fast_thread_switching():
+    """Switch threads as often as possible to surface races"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+def make_texts(extractor, sample_resume, count=20, seed=21):
+    """Seeded random resumes mixing resume words and skill names"""
+    rng = random.Random(seed)
+    words = sample_resume.split() + extractor.skill_names + ['c++', 'c#', '.net', 'node.js', 'js', 'ml', 'py']
+    return [sample_resume] + [' '.join(rng.choice(words) for _ in range(rng.randint(5, 400))) for _ in range(count)]
+
+def run_mixed_call(extractor, analyzer, texts, roles, categories, i):
+    """One mixed extraction and analysis call, selected deterministically by i"""
+    text = texts[i % len(texts)]
+    required = extractor.get_job_role_skills(roles[i % len(roles)])
+    skills = extractor.extract_skills_combined(text)
+    return (
+        skills,
+        extractor.extract_skills_batch(texts[i % 5:i % 5 + 3]),
+        extractor.rank_roles(skills),
+        analyzer.analyze_skill_gaps(skills, required),
+        analyzer.get_skill_category_analysis(skills, required, categories),
+    )
+
+@pytest.mark.parametrize('shared_cache', [False, True], ids=['no-cache', 'shared-cache'])
+def test_shared_instances_match_single_threaded(sample_resume, fast_thread_switching, shared_cache):
+    from nlp_modules.result_cache import ResultCache
+    from nlp_modules.skill_extractor import SkillExtractor
+    from utils.skill_analyzer import SkillAnalyzer
+    
+    reference_extractor = SkillExtractor(JOB_SKILLS_PATH)
+    reference_analyzer = SkillAnalyzer()
+    texts = make_texts(reference_extractor, sample_resume)
+    roles = reference_extractor.get_all_job_roles()
+    categories = reference_extractor.job_skills_data['technical_skills_database']
+    
+    expected = [run_mixed_call(reference_extractor, reference_analyzer, texts, roles, categories, i)
+                for i in range(NUM_CALLS)]
+    
+    result_cache = ResultCache(max_entries=8) if shared_cache else None
+    extractor = SkillExtractor(JOB_SKILLS_PATH, result_cache=result_cache)
+    analyzer = SkillAnalyzer()
+    # Keep the token vocabulary tiny so it is replaced while threads use it
+    extractor.MAX_VOCABULARY_SIZE = 50
+    
+    with ThreadPoolExecutor(NUM_THREADS) as pool:
+        results = list(pool.map(
+            lambda i: run_mixed_call(extractor, analyzer, texts, roles, categories, i),
+            range(NUM_CALLS)))
+    
+    for i, result in enumerate(results):
+        assert result == expected[i], f"call {i} differs from the single-threaded result"
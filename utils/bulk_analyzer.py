@@ -0,0 +1,608 @@
+"""
+Bulk Resume Analysis
+Headless pipeline that screens a directory of resumes against job roles
+
+Each resume is read, its text extracted, its skills scored and its skill gaps
+analyzed for every requested role, on a pool of worker processes. Results are
+written as one JSON line per resume, in input order, with only a bounded
+window of resumes in flight, so memory stays flat on large backlogs.
+
+With a checkpoint, finished resumes are recorded by path and content digest
+and skipped when an interrupted run is restarted. With --shard i/N, several
+machines split one corpus by path hash without any coordination, and their
+outputs are combined with the merge command.
+
+Usage:
+    python -m utils.bulk_analyzer run resumes/ -r "Data Scientist" -r "Data Engineer" -o results.jsonl
+    python -m utils.bulk_analyzer run resumes/ -r "Data Scientist" --shard 0/4 --checkpoint shard0.sqlite3 -o shard0.jsonl
+    python -m utils.bulk_analyzer merge shard*.jsonl -o results.jsonl
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_KB_PATH = os.environ.get(
+    'RESUME_ANALYZER_KB',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'job_skills.json')
+)
+RESUME_SUFFIXES = ('.pdf', '.txt')
+STAGES = ('read', 'extract_text', 'extract_skills', 'analyze')
+
+# Resumes submitted per worker ahead of the one being written
+IN_FLIGHT_PER_JOB = 4
+
+# Resumes written between checkpoint commits; a crash repeats at most these
+CHECKPOINT_EVERY = 100
+
+_CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_config (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS processed (
+    path TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    error TEXT,
+    finished REAL NOT NULL,
+    PRIMARY KEY (path, digest)
+);
+"""
+
+# Per-process engine, built once by the pool initializer (or inherited from
+# the parent when workers are forked)
+_engine = None
+
+def iter_resume_paths(inputs: Iterable[str]) -> Iterator[str]:
+    """
+    Expand files, directories and glob patterns into resume paths
+    
+    Args:
+        inputs: Files, directories (searched recursively) or glob patterns
+    
+    Yields:
+        PDF and text file paths, each once, sorted within each input
+    """
+    seen = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            paths = glob.glob(os.path.join(item, '**', '*'), recursive=True)
+        elif os.path.isfile(item):
+            paths = [item]
+        else:
+            paths = glob.glob(item, recursive=True)
+        
+        for path in sorted(paths):
+            if not os.path.isfile(path) or not path.lower().endswith(RESUME_SUFFIXES):
+                continue
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                yield path
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification
+    
+    Args:
+        spec: 'i/N' with 0 <= i < N
+    
+    Returns:
+        (index, count)
+    
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{spec}', expected 0 <= i < N")
+    return index, count
+
+def in_shard(path: str, shard: Tuple[int, int]) -> bool:
+    """
+    Check whether a resume belongs to a shard
+    
+    The partition depends only on the path as produced from the inputs, so
+    every machine given the same input arguments over the same corpus layout
+    agrees on it without reading any file.
+    
+    Args:
+        path: Resume path from iter_resume_paths
+        shard: (index, count) from parse_shard
+    """
+    index, count = shard
+    key = os.path.normpath(path).replace(os.sep, '/').encode('utf-8', 'surrogateescape')
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big') % count == index
+
+def decode_resume_text(data: bytes) -> str:
+    """Decode a plain-text resume, falling back to latin-1 like the upload path"""
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+class BulkEngine:
+    """Skill extractor and analyzer pair used by one worker process"""
+    
+    def __init__(self, kb_path: str, roles: List[str]):
+        """
+        Load the knowledge base and look up the requested roles
+        
+        Args:
+            kb_path: job_skills.json or a compiled .kb artifact
+            roles: Job roles every resume is analyzed against
+        
+        Raises:
+            ValueError: If a role is not in the knowledge base
+        """
+        from nlp_modules.skill_extractor import SkillExtractor
+        from utils.skill_analyzer import SkillAnalyzer
+        
+        self.skill_extractor = SkillExtractor(kb_path)
+        unknown = [role for role in roles if role not in self.skill_extractor.job_skills_data['job_roles']]
+        if unknown:
+            raise ValueError(f"Unknown job roles {unknown}, expected some of {self.skill_extractor.role_names}")
+        
+        self.roles = {role: self.skill_extractor.get_job_role_skills(role) for role in roles}
+        self.skill_analyzer = SkillAnalyzer()
+    
+    def analyze_file(self, path: str) -> Tuple[Dict, Dict[str, float]]:
+        """
+        Run the full pipeline on one resume, isolating any failure to its record
+        
+        Args:
+            path: PDF or text resume
+        
+        Returns:
+            (result record, seconds spent in each stage)
+        """
+        timings = dict.fromkeys(STAGES, 0.0)
+        record: Dict = {'path': path}
+        stage = 'read'
+        try:
+            start = time.perf_counter()
+            with open(path, 'rb') as f:
+                data = f.read()
+            record['digest'] = hashlib.sha256(data).hexdigest()
+            timings['read'] = time.perf_counter() - start
+            
+            if path.lower().endswith('.pdf'):
+                # Skills are extracted while pages stream in, within the
+                # PDFExtractor page/char/time budgets
+                from utils.pdf_extractor import PDFExtractor
+                stage = 'extract_text'
+                start = time.perf_counter()
+                pages = PDFExtractor.iter_pages(data)
+                skills = self.skill_extractor.extract_skills_from_pages(pages)
+                timings['extract_text'] = pages.extract_seconds
+                timings['extract_skills'] = time.perf_counter() - start - pages.extract_seconds
+                record['chars'] = pages.chars
+                record['pages'] = pages.pages_read
+                if pages.truncated:
+                    record['truncated'] = pages.truncation_reason
+            else:
+                stage = 'extract_text'
+                start = time.perf_counter()
+                text = decode_resume_text(data)
+                record['chars'] = len(text)
+                timings['extract_text'] = time.perf_counter() - start
+                
+                stage = 'extract_skills'
+                start = time.perf_counter()
+                skills = self.skill_extractor.extract_skills_combined(text)
+                timings['extract_skills'] = time.perf_counter() - start
+            record['skills'] = skills
+            
+            stage = 'analyze'
+            start = time.perf_counter()
+            record['roles'] = {
+                role: self.skill_analyzer.analyze_skill_gaps(skills, required_skills)
+                for role, required_skills in self.roles.items()
+            }
+            timings['analyze'] = time.perf_counter() - start
+        except Exception as e:
+            record['error'] = f"{stage}: {type(e).__name__}: {e}"
+        
+        return record, timings
+
+class BulkCheckpoint:
+    """
+    SQLite record of the resumes a bulk run has finished
+    
+    Resumes are identified by path and content digest, the same key merge
+    uses, so a file edited since it was processed is analyzed again and
+    identical files at different paths each get their own record. Marks are
+    committed in batches after the output they cover has been synced to
+    disk, so an interrupted run can repeat a few output lines but never lose
+    one; merge drops the repeats.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the checkpoint database
+        
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_CHECKPOINT_SCHEMA)
+        self._conn.commit()
+        self._uncommitted = 0
+    
+    def bind(self, config: Dict[str, str]) -> None:
+        """
+        Tie the checkpoint to a run configuration
+        
+        Args:
+            config: Settings that must not change between restarts (roles,
+                knowledge base version, shard)
+        
+        Raises:
+            ValueError: If the checkpoint was written with other settings
+        """
+        stored = dict(self._conn.execute('SELECT key, value FROM run_config'))
+        if stored and stored != config:
+            changed = sorted(key for key in set(stored) | set(config) if stored.get(key) != config.get(key))
+            raise ValueError(f"Checkpoint {self.path} was written with different settings: {changed}")
+        if not stored:
+            self._conn.executemany('INSERT INTO run_config (key, value) VALUES (?, ?)', config.items())
+            self._conn.commit()
+    
+    def is_done(self, path: str, digest: str) -> bool:
+        """Check whether a resume was already processed with this content"""
+        return self._conn.execute(
+            'SELECT 1 FROM processed WHERE path = ? AND digest = ?', (path, digest)
+        ).fetchone() is not None
+    
+    def mark(self, record: Dict) -> None:
+        """
+        Record a finished resume (committed by the next commit)
+        
+        Args:
+            record: Output record with path, digest and optional error
+        """
+        if 'digest' not in record:
+            return
+        self._conn.execute(
+            'INSERT OR REPLACE INTO processed (path, digest, error, finished) VALUES (?, ?, ?, ?)',
+            (record['path'], record['digest'], record.get('error'), time.time())
+        )
+        self._uncommitted += 1
+    
+    def commit(self) -> None:
+        """Make all marks durable"""
+        self._conn.commit()
+        self._uncommitted = 0
+    
+    def stats(self) -> Dict:
+        """Get processed and failed resume counts"""
+        processed, failed = self._conn.execute(
+            'SELECT COUNT(*), COUNT(error) FROM processed'
+        ).fetchone()
+        return {'path': self.path, 'processed': processed, 'errors': failed}
+    
+    def close(self) -> None:
+        self.commit()
+        self._conn.close()
+
+def _file_digest(path: str) -> Optional[str]:
+    """SHA-256 of a file, or None if it cannot be read (the worker reports it)"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def _sync_output(output) -> None:
+    """Flush the output to disk, so checkpoint marks never get ahead of it"""
+    output.flush()
+    try:
+        fileno = output.fileno()
+    except (AttributeError, OSError):
+        return
+    os.fsync(fileno)
+
+def _init_worker(kb_path: str, roles: List[str]) -> None:
+    global _engine
+    # Resumes are already spread over the pool, so pages are not split further
+    from utils.pdf_extractor import PDFExtractor
+    PDFExtractor.page_workers = 1
+    
+    if _engine is None:
+        _engine = BulkEngine(kb_path, roles)
+
+def _analyze_in_worker(path: str) -> Tuple[Dict, Dict[str, float]]:
+    return _engine.analyze_file(path)
+
+def run(paths: Iterable[str], kb_path: str, roles: List[str], output,
+        jobs: int = 1, checkpoint: Optional[BulkCheckpoint] = None,
+        shard: Optional[Tuple[int, int]] = None) -> Dict:
+    """
+    Analyze resumes and write one JSON line per resume
+    
+    Args:
+        paths: Resume files, in output order
+        kb_path: job_skills.json or a compiled .kb artifact
+        roles: Job roles to analyze each resume against
+        output: Text stream the JSON lines are written to
+        jobs: Worker processes (1 runs in this process)
+        checkpoint: Skip resumes it records as done and record new ones
+        shard: Only process the (index, count) shard of the paths
+    
+    Returns:
+        Throughput summary: document, error, skip and truncation counts,
+        engine load and wall time, docs/sec and total and mean per-document
+        seconds of each stage
+    
+    Raises:
+        ValueError: If a role is unknown or the checkpoint belongs to another run
+    """
+    global _engine
+    start = time.perf_counter()
+    
+    # Built here before the pool starts, so role errors surface at once and
+    # forked workers inherit the engine instead of loading their own
+    _engine = BulkEngine(kb_path, roles)
+    load_seconds = time.perf_counter() - start
+    
+    if checkpoint is not None:
+        checkpoint.bind({
+            'roles': json.dumps(sorted(roles)),
+            'knowledge_base_version': _engine.skill_extractor.knowledge_base_version,
+            'shard': '/'.join(map(str, shard)) if shard else 'all'
+        })
+    
+    stage_totals = dict.fromkeys(STAGES, 0.0)
+    documents = errors = skipped = truncated = 0
+    
+    def pending_paths() -> Iterator[str]:
+        nonlocal skipped
+        for path in paths:
+            if shard is not None and not in_shard(path, shard):
+                continue
+            if checkpoint is not None:
+                digest = _file_digest(path)
+                if digest is not None and checkpoint.is_done(path, digest):
+                    skipped += 1
+                    continue
+            yield path
+    
+    def write(result: Tuple[Dict, Dict[str, float]]) -> None:
+        nonlocal documents, errors, truncated
+        record, timings = result
+        output.write(json.dumps(record) + '\n')
+        documents += 1
+        errors += 'error' in record
+        truncated += 'truncated' in record
+        for stage, seconds in timings.items():
+            stage_totals[stage] += seconds
+        
+        if checkpoint is not None:
+            checkpoint.mark(record)
+            if documents % CHECKPOINT_EVERY == 0:
+                _sync_output(output)
+                checkpoint.commit()
+    
+    try:
+        if jobs <= 1:
+            for path in pending_paths():
+                write(_engine.analyze_file(path))
+        else:
+            # A bounded window of pending futures keeps memory flat and lets
+            # results be written in input order
+            pending: deque = deque()
+            
+            def start_pool() -> ProcessPoolExecutor:
+                return ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                           initargs=(kb_path, roles))
+            
+            def recover(pool: ProcessPoolExecutor, error: BrokenProcessPool) -> ProcessPoolExecutor:
+                # A worker died (e.g. OOM-killed), which fails every file in
+                # flight; finished ones are kept, the rest are recorded as
+                # errors and the run continues on a fresh pool
+                while pending:
+                    path, future = pending.popleft()
+                    if future.done() and not future.cancelled() and future.exception() is None:
+                        write(future.result())
+                    else:
+                        write(({'path': path, 'error': f"worker: {type(error).__name__}: {error}"},
+                               dict.fromkeys(STAGES, 0.0)))
+                pool.shutdown(wait=False, cancel_futures=True)
+                return start_pool()
+            
+            def collect(pool: ProcessPoolExecutor) -> ProcessPoolExecutor:
+                try:
+                    result = pending[0][1].result()
+                except BrokenProcessPool as e:
+                    return recover(pool, e)
+                pending.popleft()
+                write(result)
+                return pool
+            
+            pool = start_pool()
+            try:
+                for path in pending_paths():
+                    try:
+                        future = pool.submit(_analyze_in_worker, path)
+                    except BrokenProcessPool as e:
+                        pool = recover(pool, e)
+                        future = pool.submit(_analyze_in_worker, path)
+                    pending.append((path, future))
+                    if len(pending) >= jobs * IN_FLIGHT_PER_JOB:
+                        pool = collect(pool)
+                while pending:
+                    pool = collect(pool)
+            finally:
+                pool.shutdown()
+    finally:
+        _engine = None
+        if checkpoint is not None:
+            _sync_output(output)
+            checkpoint.commit()
+    
+    wall = time.perf_counter() - start
+    return {
+        'documents': documents,
+        'errors': errors,
+        'skipped': skipped,
+        'truncated': truncated,
+        'jobs': jobs,
+        'load_seconds': round(load_seconds, 3),
+        'wall_seconds': round(wall, 3),
+        'docs_per_second': round(documents / (wall - load_seconds), 2) if documents else 0.0,
+        'stage_seconds': {stage: round(seconds, 3) for stage, seconds in stage_totals.items()},
+        'stage_ms_per_doc': {
+            stage: round(seconds * 1000 / documents, 2) if documents else 0.0
+            for stage, seconds in stage_totals.items()
+        }
+    }
+
+def merge(inputs: Iterable[str], output) -> Dict:
+    """
+    Combine JSONL outputs of shards or restarted runs into one
+    
+    Records are kept in input order, and later records for a resume already
+    seen (same path and content digest) are dropped. An error record without
+    a digest (the file could not be read, or its worker died) is superseded
+    by any other record for the same path, since a restart retries it; only
+    the first one is kept if the path never gets another outcome.
+    Truncated lines left by an interrupted run are skipped.
+    
+    Args:
+        inputs: JSONL files written by run
+        output: Text stream the merged lines are written to
+    
+    Returns:
+        Counts of written, duplicate and malformed lines
+    """
+    inputs = list(inputs)
+    
+    # First pass: paths with a digest-bearing record, which supersede
+    # digest-less error records wherever they appear
+    digested = set()
+    for record in _iter_records(inputs):
+        if record is not None and record.get('digest') is not None:
+            digested.add(record['path'])
+    
+    seen = set()
+    written = duplicates = malformed = 0
+    for record in _iter_records(inputs):
+        if record is None:
+            malformed += 1
+            continue
+        key = (record['path'], record.get('digest'))
+        if key in seen or (key[1] is None and key[0] in digested):
+            duplicates += 1
+            continue
+        seen.add(key)
+        output.write(json.dumps(record) + '\n')
+        written += 1
+    return {'written': written, 'duplicates': duplicates, 'malformed': malformed}
+
+def _iter_records(inputs: List[str]) -> Iterator[Optional[Dict]]:
+    """Parse JSONL records with a path, yielding None for malformed non-blank lines"""
+    for path in inputs:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if not isinstance(record, dict) or 'path' not in record:
+                    if line.strip():
+                        yield None
+                    continue
+                yield record
+
+def _open_output(path: str, append: bool):
+    """Open the JSONL output, ending any line cut off by an interrupted run"""
+    if path == '-':
+        return sys.stdout
+    if append and os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            complete = f.read(1) == b'\n'
+        output = open(path, 'a', encoding='utf-8')
+        if not complete:
+            output.write('\n')
+        return output
+    return open(path, 'w', encoding='utf-8')
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Analyze a batch of resumes against job roles, or merge run outputs"""
+    parser = argparse.ArgumentParser(description='Analyze a batch of resumes against job roles')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = subparsers.add_parser('run', help='Analyze resumes into a JSONL file')
+    run_parser.add_argument('inputs', nargs='+', help='Resume files, directories or glob patterns (PDF/TXT)')
+    run_parser.add_argument('-r', '--role', dest='roles', action='append', required=True,
+                            help='Job role to analyze against (repeatable)')
+    run_parser.add_argument('-o', '--output', default='-', help='JSONL output file (default stdout)')
+    run_parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                            help='Worker processes (default: CPU count)')
+    run_parser.add_argument('--kb', default=DEFAULT_KB_PATH,
+                            help='Knowledge base (job_skills.json or compiled .kb artifact)')
+    run_parser.add_argument('--checkpoint', default=None,
+                            help='SQLite file recording finished resumes; a rerun appends to '
+                                 'the output and skips them')
+    run_parser.add_argument('--shard', default=None, metavar='I/N',
+                            help='Only process shard I of N (0-based), partitioned by path hash')
+    
+    merge_parser = subparsers.add_parser('merge', help='Combine run outputs, dropping duplicates')
+    merge_parser.add_argument('inputs', nargs='+', help='JSONL files written by run')
+    merge_parser.add_argument('-o', '--output', default='-', help='Merged JSONL file (default stdout)')
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'merge':
+        output = _open_output(args.output, append=False)
+        try:
+            summary = merge(args.inputs, output)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        print(json.dumps(summary, indent=2), file=sys.stderr)
+        return
+    
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        run_parser.error(str(e))
+    if args.checkpoint and args.output == '-':
+        run_parser.error('--checkpoint needs an --output file to append to')
+    
+    checkpoint = BulkCheckpoint(args.checkpoint) if args.checkpoint else None
+    output = _open_output(args.output, append=checkpoint is not None)
+    try:
+        summary = run(iter_resume_paths(args.inputs), args.kb, args.roles, output,
+                      jobs=args.jobs, checkpoint=checkpoint, shard=shard)
+    except ValueError as e:
+        run_parser.error(str(e))
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+        if output is not sys.stdout:
+            output.close()
+    
+    # The summary goes to stderr so stdout stays valid JSONL
+    print(json.dumps(summary, indent=2), file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+"""
+Persistent PDF Text Cache
+SQLite store mapping the SHA-256 of uploaded PDF bytes to their extracted text
+
+Usage:
+    python -m utils.pdf_cache stats
+    python -m utils.pdf_cache list [--limit N]
+    python -m utils.pdf_cache purge [--older-than DAYS]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    'PDF_TEXT_CACHE',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'pdf_text.sqlite3')
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pdf_text (
+    digest TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    page_chars TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pdf_text_last_access ON pdf_text (last_access);
+"""
+
+class PDFTextCache:
+    """Size-bounded on-disk cache of extracted PDF text, shareable across processes"""
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (and create if needed) the cache database
+        
+        Args:
+            path: SQLite database file
+            max_bytes: Maximum total size of cached text before least recently
+                used entries are evicted
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with self._connect() as conn:
+            # WAL lets several gunicorn workers read while one writes
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection, so the cache is safe across threads and forked workers"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """SHA-256 hex digest used as the cache key"""
+        return hashlib.sha256(data).hexdigest()
+    
+    def get(self, digest: str) -> Optional[Tuple[str, List[int]]]:
+        """
+        Look up extracted text
+        
+        Args:
+            digest: SHA-256 of the PDF bytes
+        
+        Returns:
+            (text, per-page character counts) or None if not cached
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT text, page_chars FROM pdf_text WHERE digest = ?', (digest,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            conn.execute(
+                'UPDATE pdf_text SET last_access = ? WHERE digest = ?', (time.time(), digest)
+            )
+        
+        return row[0], json.loads(row[1])
+    
+    def put(self, digest: str, text: str, page_chars: List[int]) -> None:
+        """
+        Store extracted text and evict least recently used entries above the size cap
+        
+        Args:
+            digest: SHA-256 of the PDF bytes
+            text: Extracted text
+            page_chars: Number of characters extracted from each page
+        """
+        size = len(text.encode('utf-8', 'surrogatepass'))
+        if size > self.max_bytes:
+            return
+        
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO pdf_text (digest, text, page_chars, size, created, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (digest, text, json.dumps(page_chars), size, now, now)
+            )
+            self._evict(conn)
+    
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Delete least recently used entries until the total size fits max_bytes"""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM pdf_text').fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        
+        evicted = 0
+        for digest, size in conn.execute(
+            'SELECT digest, size FROM pdf_text ORDER BY last_access ASC'
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute('DELETE FROM pdf_text WHERE digest = ?', (digest,))
+            total -= size
+            evicted += 1
+        return evicted
+    
+    def stats(self) -> Dict:
+        """Get entry count and total cached text size"""
+        with self._connect() as conn:
+            entries, total = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pdf_text'
+            ).fetchone()
+        return {
+            'path': self.path,
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes
+        }
+    
+    def entries(self, limit: int = 20) -> List[Dict]:
+        """List the most recently used entries"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT digest, size, page_chars, created, last_access FROM pdf_text '
+                'ORDER BY last_access DESC LIMIT ?', (limit,)
+            ).fetchall()
+        return [
+            {
+                'digest': digest,
+                'bytes': size,
+                'pages': len(json.loads(page_chars)),
+                'created': created,
+                'last_access': last_access
+            }
+            for digest, size, page_chars, created, last_access in rows
+        ]
+    
+    def purge(self, older_than: Optional[float] = None) -> int:
+        """
+        Delete cached entries
+        
+        Args:
+            older_than: Only delete entries not used for this many seconds
+                (all entries if None)
+        
+        Returns:
+            Number of deleted entries
+        """
+        with self._connect() as conn:
+            if older_than is None:
+                cursor = conn.execute('DELETE FROM pdf_text')
+            else:
+                cursor = conn.execute(
+                    'DELETE FROM pdf_text WHERE last_access < ?', (time.time() - older_than,)
+                )
+            return cursor.rowcount
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Inspect or purge the PDF text cache"""
+    parser = argparse.ArgumentParser(description='Inspect or purge the PDF text cache')
+    parser.add_argument('--path', default=DEFAULT_CACHE_PATH, help='SQLite cache file')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    subparsers.add_parser('stats', help='Show entry count and size')
+    
+    list_parser = subparsers.add_parser('list', help='List most recently used entries')
+    list_parser.add_argument('--limit', type=int, default=20)
+    
+    purge_parser = subparsers.add_parser('purge', help='Delete cached entries')
+    purge_parser.add_argument('--older-than', type=float, default=None, metavar='DAYS',
+                              help='Only delete entries unused for this many days')
+    
+    args = parser.parse_args(argv)
+    cache = PDFTextCache(args.path)
+    
+    if args.command == 'stats':
+        print(json.dumps(cache.stats(), indent=2))
+    elif args.command == 'list':
+        for entry in cache.entries(args.limit):
+            print(json.dumps(entry))
+    elif args.command == 'purge':
+        older_than = args.older_than * 86400 if args.older_than is not None else None
+        print(f"Deleted {cache.purge(older_than)} entries")
+
+if __name__ == '__main__':
+    main()
@@ -4,9 +4,16 @@ Handles PDF text extraction for resume processing
 """
 
 import io
-from typing import Optional
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Iterable, Iterator, List, Optional
 import streamlit as st
 
+from utils.pdf_cache import PDFTextCache
+
 # Try to import PyPDF2, provide fallback if not available
 try:
     import PyPDF2
@@ -14,9 +21,221 @@ try:
 except ImportError:
     PYPDF2_AVAILABLE = False
 
+# Process pool for page extraction of long documents, created on first use
+_PAGE_POOL_START_METHOD = (
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_workers = 0
+_page_pool_lock = threading.Lock()
+
+def _reset_page_pool_after_fork() -> None:
+    # A forked child inherits the pool object but none of its workers
+    global _page_pool, _page_pool_workers, _page_pool_lock
+    _page_pool = None
+    _page_pool_workers = 0
+    _page_pool_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_page_pool_after_fork)
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """Shared page extraction pool with the given number of workers"""
+    global _page_pool, _page_pool_workers
+    with _page_pool_lock:
+        if _page_pool is None or _page_pool_workers != workers:
+            if _page_pool is not None:
+                _page_pool.shutdown(wait=False)
+            # Forking a threaded server (Streamlit, Flask) can copy held locks
+            # into the child, so workers start from a clean forkserver instead
+            _page_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(_PAGE_POOL_START_METHOD)
+            )
+            _page_pool_workers = workers
+        return _page_pool
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) in a worker process"""
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    return [pdf_reader.pages[i].extract_text() for i in range(start, stop)]
+
+class PageStream:
+    """
+    Page texts of a PDF, extracted lazily within page, character and time budgets
+    
+    Iterating yields the text of each page as soon as it is extracted, so
+    consumers can start work before the document is finished. Extraction
+    stops at the first exhausted budget, and truncated / truncation_reason
+    tell the caller the text is incomplete. A stream can be iterated once.
+    """
+    
+    def __init__(self, pdf_bytes: bytes, max_pages: int = 0, max_chars: int = 0,
+                 deadline_seconds: float = 0, parallel_page_threshold: int = 0,
+                 page_workers: int = 1):
+        """
+        Open the PDF (pages are not extracted until iteration)
+        
+        Args:
+            pdf_bytes: Raw PDF file content
+            max_pages: Maximum pages to extract (0 for no limit)
+            max_chars: Maximum characters to yield; the page crossing the limit
+                is cut at a word boundary (0 for no limit)
+            deadline_seconds: Wall-clock budget from the start of iteration (0
+                for no limit); a page already being extracted is finished
+            parallel_page_threshold: Extract pages on the page pool when at
+                least this many are to be read (0 never)
+            page_workers: Processes used for parallel extraction
+        
+        Raises:
+            ImportError: If PyPDF2 is not installed
+            Exception: Any PyPDF2 error for a malformed PDF
+        """
+        if not PYPDF2_AVAILABLE:
+            raise ImportError("PyPDF2 is not installed. Please install it using: pip install PyPDF2")
+        
+        self.pdf_bytes = pdf_bytes
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.deadline_seconds = deadline_seconds
+        self.parallel_page_threshold = parallel_page_threshold
+        self.page_workers = page_workers
+        
+        self._pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        self.page_count = len(self._pdf_reader.pages)
+        self.page_chars: List[int] = []
+        self.chars = 0
+        self.truncated = False
+        self.truncation_reason: Optional[str] = None
+        self.extract_seconds = 0.0
+    
+    @property
+    def pages_read(self) -> int:
+        return len(self.page_chars)
+    
+    def _truncate(self, reason: str) -> None:
+        self.truncated = True
+        self.truncation_reason = reason
+    
+    def __iter__(self) -> Iterator[str]:
+        num_pages = self.page_count
+        if self.max_pages and self.max_pages < num_pages:
+            num_pages = self.max_pages
+        deadline = time.monotonic() + self.deadline_seconds if self.deadline_seconds else None
+        
+        if self.page_workers > 1 and 0 < self.parallel_page_threshold <= num_pages:
+            page_texts = self._iter_parallel(num_pages, deadline)
+        else:
+            page_texts = self._iter_sequential(num_pages, deadline)
+        
+        for page_text in page_texts:
+            self.page_chars.append(len(page_text))
+            if self.max_chars and self.chars + len(page_text) > self.max_chars:
+                page_text = _cut_at_word(page_text, self.max_chars - self.chars)
+                self.chars += len(page_text)
+                self._truncate('max_chars')
+                page_texts.close()
+                yield page_text
+                return
+            self.chars += len(page_text)
+            yield page_text
+        
+        if not self.truncated and num_pages < self.page_count:
+            self._truncate('max_pages')
+    
+    def _iter_sequential(self, num_pages: int, deadline: Optional[float]) -> Iterator[str]:
+        pages = self._pdf_reader.pages
+        for page_num in range(num_pages):
+            if deadline is not None and time.monotonic() >= deadline:
+                self._truncate('deadline')
+                return
+            start = time.perf_counter()
+            page_text = pages[page_num].extract_text()
+            self.extract_seconds += time.perf_counter() - start
+            yield page_text
+    
+    def _iter_parallel(self, num_pages: int, deadline: Optional[float]) -> Iterator[str]:
+        """Extract one contiguous page range per worker and yield ranges in order"""
+        workers = min(self.page_workers, num_pages)
+        pool = _get_page_pool(self.page_workers)
+        
+        # Each worker parses the document once for its whole range
+        bounds = [num_pages * i // workers for i in range(workers + 1)]
+        futures = [
+            pool.submit(_extract_page_range, self.pdf_bytes, start, stop)
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+        try:
+            for future in futures:
+                start = time.perf_counter()
+                try:
+                    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                    page_texts = future.result(timeout=timeout)
+                except FutureTimeoutError:
+                    self._truncate('deadline')
+                    return
+                finally:
+                    self.extract_seconds += time.perf_counter() - start
+                yield from page_texts
+        finally:
+            # Ranges not yet started are dropped when the consumer stops early
+            for future in futures:
+                future.cancel()
+
+def join_pages(page_texts: Iterable[str]) -> str:
+    """Join page texts into document text, skipping blank pages"""
+    return "\n".join(page_text for page_text in page_texts if page_text.strip()).strip()
+
+def _cut_at_word(text: str, limit: int) -> str:
+    """Cut text to at most limit characters, at the last whitespace if there is one"""
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    boundary = max(cut.rfind(' '), cut.rfind('\n'))
+    return cut[:boundary] if boundary > 0 else cut
+
 class PDFExtractor:
     """PDF text extraction utility"""
     
+    # Optional persistent text cache; enabled by setting PDF_TEXT_CACHE to a
+    # database path or by calling enable_cache()
+    text_cache: Optional[PDFTextCache] = (
+        PDFTextCache(os.environ['PDF_TEXT_CACHE']) if os.environ.get('PDF_TEXT_CACHE') else None
+    )
+    
+    # Documents with at least this many pages are split across page_workers
+    # processes (PDF_PARALLEL_PAGES, 0 disables); shorter ones are not worth
+    # the cost of re-parsing the PDF in each worker. Every server process
+    # gets its own pool, so it is off (one worker) unless PDF_PAGE_WORKERS
+    # is set with the number of server processes in mind
+    parallel_page_threshold: int = int(os.environ.get('PDF_PARALLEL_PAGES', '16'))
+    page_workers: int = int(os.environ.get('PDF_PAGE_WORKERS', '1'))
+    
+    # Default budgets of iter_pages, so an oversized upload cannot tie up a
+    # worker (0 disables a limit)
+    max_pages: int = int(os.environ.get('PDF_MAX_PAGES', '100'))
+    max_chars: int = int(os.environ.get('PDF_MAX_CHARS', '500000'))
+    deadline_seconds: float = float(os.environ.get('PDF_DEADLINE_SECONDS', '30'))
+    
+    @staticmethod
+    def enable_cache(path: Optional[str] = None, max_bytes: Optional[int] = None) -> PDFTextCache:
+        """
+        Enable the on-disk text cache so repeat uploads skip PDF parsing
+        
+        Args:
+            path: SQLite database file (defaults to PDF_TEXT_CACHE or .cache/)
+            max_bytes: Maximum total size of cached text
+            
+        Returns:
+            The active cache
+        """
+        kwargs = {}
+        if path is not None:
+            kwargs['path'] = path
+        if max_bytes is not None:
+            kwargs['max_bytes'] = max_bytes
+        PDFExtractor.text_cache = PDFTextCache(**kwargs)
+        return PDFExtractor.text_cache
+    
     @staticmethod
     def is_available() -> bool:
         """Check if PDF extraction is available"""
@@ -33,31 +252,101 @@ class PDFExtractor:
         Returns:
             Extracted text or None if extraction fails
         """
-        if not PYPDF2_AVAILABLE:
-            st.error("PyPDF2 is not installed. Please install it using: pip install PyPDF2")
-            return None
+        # Read PDF file
+        pdf_bytes = pdf_file.read()
+        
+        # Repeat uploads are served from the cache without touching PyPDF2
+        text_cache = PDFExtractor.text_cache
+        if text_cache is not None:
+            digest = PDFTextCache.digest(pdf_bytes)
+            cached = text_cache.get(digest)
+            if cached is not None:
+                return cached[0]
         
         try:
-            # Read PDF file
-            pdf_bytes = pdf_file.read()
-            pdf_stream = io.BytesIO(pdf_bytes)
-            
-            # Create PDF reader
-            pdf_reader = PyPDF2.PdfReader(pdf_stream)
-            
-            # Extract text from all pages
-            text = ""
-            for page_num, page in enumerate(pdf_reader.pages):
-                page_text = page.extract_text()
-                if page_text.strip():
-                    text += page_text + "\n"
-            
-            return text.strip()
-            
+            pages = PDFExtractor.iter_pages(pdf_bytes)
+            text = join_pages(pages)
+        except ImportError as e:
+            st.error(str(e))
+            return None
         except Exception as e:
             st.error(f"Error extracting text from PDF: {str(e)}")
             return None
     
+        if pages.truncated:
+            # Incomplete text is not cached, so raising a budget takes effect
+            st.warning(
+                f"Only the first {pages.pages_read} of {pages.page_count} pages were analyzed "
+                f"(limit reached: {pages.truncation_reason})."
+            )
+        elif text_cache is not None:
+            text_cache.put(digest, text, pages.page_chars)
+        
+        return text
+    
+    @staticmethod
+    def iter_pages(pdf_bytes: bytes, max_pages: Optional[int] = None,
+                   max_chars: Optional[int] = None,
+                   deadline_seconds: Optional[float] = None) -> PageStream:
+        """
+        Stream the page texts of a PDF within budgets
+        
+        Args:
+            pdf_bytes: Raw PDF file content
+            max_pages: Maximum pages to extract (defaults to PDFExtractor.max_pages)
+            max_chars: Maximum characters (defaults to PDFExtractor.max_chars)
+            deadline_seconds: Wall-clock budget (defaults to PDFExtractor.deadline_seconds)
+        
+        Returns:
+            PageStream yielding page texts; check its truncated flag after use
+        
+        Raises:
+            ImportError: If PyPDF2 is not installed
+            Exception: Any PyPDF2 error for a malformed PDF
+        """
+        return PageStream(
+            pdf_bytes,
+            max_pages=PDFExtractor.max_pages if max_pages is None else max_pages,
+            max_chars=PDFExtractor.max_chars if max_chars is None else max_chars,
+            deadline_seconds=(PDFExtractor.deadline_seconds if deadline_seconds is None
+                              else deadline_seconds),
+            parallel_page_threshold=PDFExtractor.parallel_page_threshold,
+            page_workers=PDFExtractor.page_workers
+        )
+    
+    @staticmethod
+    def extract_text_from_bytes(pdf_bytes: bytes) -> str:
+        """
+        Extract the full text of PDF content, raising instead of reporting to the UI
+        
+        No budgets apply; use iter_pages for untrusted documents.
+        
+        Args:
+            pdf_bytes: Raw PDF file content
+            
+        Returns:
+            Extracted text
+            
+        Raises:
+            ImportError: If PyPDF2 is not installed
+            Exception: Any PyPDF2 error for a malformed PDF
+        """
+        # Repeat uploads are served from the cache without touching PyPDF2
+        text_cache = PDFExtractor.text_cache
+        if text_cache is not None:
+            digest = PDFTextCache.digest(pdf_bytes)
+            cached = text_cache.get(digest)
+            if cached is not None:
+                return cached[0]
+        
+        # Extract text from all pages, in parallel for long documents
+        pages = PDFExtractor.iter_pages(pdf_bytes, max_pages=0, max_chars=0, deadline_seconds=0)
+        text = join_pages(pages)
+        if text_cache is not None:
+            text_cache.put(digest, text, pages.page_chars)
+        
+        return text
+    
     @staticmethod
     def extract_text_from_uploaded_file(uploaded_file) -> Optional[str]:
         """
@@ -3,10 +3,19 @@ Shared utilities for AI Resume Skill Gap Analyzer
 Common functions and styling used across multiple pages
 """
 
+import hashlib
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from nlp_modules.skill_extractor import SkillExtractor
+from utils.pdf_extractor import PDFExtractor
+from utils.skill_analyzer import SkillAnalyzer
+
+# Bounds for memoized per-resume results, so a long-running server cannot grow without limit
+CACHE_MAX_ENTRIES = 128
+CACHE_TTL_SECONDS = 3600
 
 def set_custom_css():
     """Apply attractive black theme styling"""
@@ -452,3 +461,75 @@ def display_skill_cards(skills: List[str], title: str, color_class: str):
         for s in skills if s and s.strip()
     ])
     st.markdown(f'<div style="line-height: 2.2;">{pills_html}</div>', unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def load_skill_extractor(job_skills_path: str) -> SkillExtractor:
+    """Load the skill extractor once per server process and share it across sessions"""
+    return SkillExtractor(job_skills_path)
+
+@st.cache_resource(show_spinner=False)
+def load_skill_analyzer() -> SkillAnalyzer:
+    """Create the skill analyzer once per server process and share it across sessions"""
+    return SkillAnalyzer()
+
+def get_file_digest(uploaded_file) -> str:
+    """SHA-256 of an uploaded file's content, used as the cache key for its results"""
+    return hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def extract_resume_text(file_digest: str, _uploaded_file) -> Optional[str]:
+    """
+    Extract text from an uploaded resume, memoized by content hash
+    
+    Args:
+        file_digest: Content hash from get_file_digest
+        _uploaded_file: Streamlit uploaded file object (not part of the cache key)
+    
+    Returns:
+        Extracted text or None if extraction fails
+    """
+    _uploaded_file.seek(0)
+    return PDFExtractor.extract_text_from_uploaded_file(_uploaded_file)
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def extract_resume_skills(job_skills_path: str, file_digest: str, _resume_text: str) -> Dict[str, float]:
+    """
+    Extract skills from resume text, memoized by content hash
+    
+    Args:
+        job_skills_path: Path to job_skills.json file
+        file_digest: Content hash of the file the text came from
+        _resume_text: Resume text (not part of the cache key)
+    
+    Returns:
+        Dictionary of skills and combined scores
+    """
+    return load_skill_extractor(job_skills_path).extract_skills_combined(_resume_text)
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def analyze_resume_for_role(job_skills_path: str, file_digest: str, job_role: str,
+                            _resume_skills: Dict[str, float]) -> Dict:
+    """
+    Run skill gap and category analysis, memoized by content hash and job role
+    
+    Args:
+        job_skills_path: Path to job_skills.json file
+        file_digest: Content hash of the analyzed resume
+        job_role: Selected job role
+        _resume_skills: Skills extracted from the resume (not part of the cache key)
+    
+    Returns:
+        Analysis results including category analysis, resume and required skills
+    """
+    skill_extractor = load_skill_extractor(job_skills_path)
+    required_skills = skill_extractor.get_job_role_skills(job_role)
+    
+    skill_analyzer = load_skill_analyzer()
+    analysis_results = skill_analyzer.analyze_skill_gaps(_resume_skills, required_skills)
+    analysis_results['category_analysis'] = skill_analyzer.get_skill_category_analysis(
+        _resume_skills, required_skills, skill_extractor.job_skills_data['technical_skills_database']
+    )
+    analysis_results['resume_skills'] = _resume_skills
+    analysis_results['required_skills'] = required_skills
+    
+    return analysis_results
@@ -3,20 +3,83 @@ Skill Gap Analysis Module
 Handles skill matching, gap analysis, and similarity calculations
 """
 
-from typing import Dict, List, Tuple
+import math
+from typing import Dict, Iterable, List, Tuple
 import numpy as np
+from sklearn.base import clone
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 class SkillAnalyzer:
-    """Skill gap analysis and matching engine"""
+    """
+    Skill gap analysis and matching engine
     
-    def __init__(self):
+    One instance can be shared by many threads: analysis methods keep their
+    working state in locals, and the requirement and category indexes are
+    only ever replaced whole.
+    """
+    
+    # Distinct required-skill lists whose vectors are kept
+    MAX_CACHED_REQUIREMENTS = 1024
+    
+    def __init__(self, legacy_similarity: bool = False):
+        """
+        Initialize the analyzer
+        
+        Args:
+            legacy_similarity: Score similarity by refitting TF-IDF on skill
+                strings for every call (the original behaviour, kept for
+                comparison) instead of using skill vectors
+        """
+        self.legacy_similarity = legacy_similarity
+        
+        # Settings template for the legacy path, which fits a clone per call
         self.tfidf_vectorizer = TfidfVectorizer(
             ngram_range=(1, 2),
             stop_words='english',
             lowercase=True
         )
+        
+        # Unit requirement vectors, stored as their distinct lowercase skills
+        # and the per-skill weight 1/sqrt(n), keyed by the required skills
+        self._requirement_vectors: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], float]] = {}
+        
+        # Skill -> category ids reverse index of the last skill_categories
+        # mapping seen, stored with that mapping as (mapping, names, index)
+        self._category_index: Tuple = (None, [], {})
+    
+    def _match_skills(self, resume_skills: Iterable[str],
+                      required_skills: List[str]) -> Tuple[List[str], List[str], Dict[str, str]]:
+        """
+        Split required skills into matched and missing in one pass
+        
+        Skills are compared case-insensitively through dict lookups. Required
+        skills keep their order (and duplicates), each reported with the casing
+        of its first occurrence in required_skills.
+        
+        Args:
+            resume_skills: Skills extracted from resume
+            required_skills: Skills required for the job
+            
+        Returns:
+            Matched skills, missing skills, and the lowercase -> original
+            resume skill index
+        """
+        resume_index = {}
+        for skill in resume_skills:
+            resume_index.setdefault(skill.lower(), skill)
+        
+        original_case = {}
+        matched, missing = [], []
+        for skill in required_skills:
+            key = skill.lower()
+            original = original_case.setdefault(key, skill)
+            if key in resume_index:
+                matched.append(original)
+            else:
+                missing.append(original)
+        
+        return matched, missing, resume_index
     
     def calculate_skill_match_percentage(self, resume_skills: List[str], 
                                        required_skills: List[str]) -> float:
@@ -30,22 +93,15 @@ class SkillAnalyzer:
         Returns:
             Match percentage (0-100)
         """
-        if not required_skills:
+        matched, _, _ = self._match_skills(resume_skills, required_skills)
+        return self._match_percentage(len(matched), len(required_skills))
+    
+    @staticmethod
+    def _match_percentage(matches: int, total: int) -> float:
+        """Percentage of matched required skills, rounded to 2 decimals"""
+        if not total:
             return 0.0
-        
-        # Convert to lowercase for comparison
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        # Count matches
-        matches = 0
-        for req_skill in required_skills_lower:
-            if req_skill in resume_skills_lower:
-                matches += 1
-        
-        # Calculate percentage
-        match_percentage = (matches / len(required_skills)) * 100
-        return round(match_percentage, 2)
+        return round((matches / total) * 100, 2)
     
     def find_matched_skills(self, resume_skills: List[str], 
                           required_skills: List[str]) -> List[str]:
@@ -59,20 +115,7 @@ class SkillAnalyzer:
         Returns:
             List of matched skills
         """
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        matched = []
-        for req_skill in required_skills_lower:
-            if req_skill in resume_skills_lower:
-                # Find the original case version
-                original_skill = next(
-                    (skill for skill in required_skills if skill.lower() == req_skill),
-                    req_skill
-                )
-                matched.append(original_skill)
-        
-        return matched
+        return self._match_skills(resume_skills, required_skills)[0]
     
     def find_missing_skills(self, resume_skills: List[str], 
                            required_skills: List[str]) -> List[str]:
@@ -86,25 +129,16 @@ class SkillAnalyzer:
         Returns:
             List of missing skills
         """
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        missing = []
-        for req_skill in required_skills_lower:
-            if req_skill not in resume_skills_lower:
-                # Find the original case version
-                original_skill = next(
-                    (skill for skill in required_skills if skill.lower() == req_skill),
-                    req_skill
-                )
-                missing.append(original_skill)
-        
-        return missing
+        return self._match_skills(resume_skills, required_skills)[1]
     
     def calculate_skill_similarity_score(self, resume_skills: Dict[str, float], 
                                        required_skills: List[str]) -> float:
         """
-        Calculate similarity score using TF-IDF and cosine similarity
+        Calculate the cosine similarity between resume and required skills
+        
+        The resume is a vector of skill scores and the requirement a binary
+        vector of its distinct skills (both keyed by lowercase skill name), so
+        the score is a normalized dot product with no model fitting.
         
         Args:
             resume_skills: Dictionary of skills and their scores
@@ -113,6 +147,41 @@ class SkillAnalyzer:
         Returns:
             Similarity score (0-1)
         """
+        if self.legacy_similarity:
+            return self._legacy_similarity_score(resume_skills, required_skills)
+        
+        if not resume_skills or not required_skills:
+            return 0.0
+        
+        weights, norm = self._resume_vector(resume_skills)
+        if not norm:
+            return 0.0
+        
+        terms, unit = self._requirement_vector(required_skills)
+        return sum(weights.get(term, 0.0) for term in terms) * unit / norm
+    
+    def _resume_vector(self, resume_skills: Dict[str, float]) -> Tuple[Dict[str, float], float]:
+        """Resume skill weights by lowercase name (first spelling wins) and their L2 norm"""
+        weights = {}
+        for skill, score in resume_skills.items():
+            weights.setdefault(skill.lower(), float(score))
+        return weights, math.sqrt(sum(weight * weight for weight in weights.values()))
+    
+    def _requirement_vector(self, required_skills: List[str]) -> Tuple[Tuple[str, ...], float]:
+        """Distinct lowercase required skills and their unit weight, cached per skill list"""
+        key = tuple(required_skills)
+        vector = self._requirement_vectors.get(key)
+        if vector is None:
+            terms = tuple(dict.fromkeys(skill.lower() for skill in required_skills))
+            vector = terms, 1.0 / math.sqrt(len(terms))
+            if len(self._requirement_vectors) >= self.MAX_CACHED_REQUIREMENTS:
+                self._requirement_vectors.clear()
+            self._requirement_vectors[key] = vector
+        return vector
+    
+    def _legacy_similarity_score(self, resume_skills: Dict[str, float],
+                                 required_skills: List[str]) -> float:
+        """Original similarity: TF-IDF refit on repeated skill strings, then cosine"""
         if not resume_skills or not required_skills:
             return 0.0
         
@@ -124,8 +193,9 @@ class SkillAnalyzer:
             return 0.0
         
         try:
-            # Calculate TF-IDF vectors
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([resume_text, required_text])
+            # Calculate TF-IDF vectors (on a per-call clone, so concurrent
+            # calls never fit the same vectorizer)
+            tfidf_matrix = clone(self.tfidf_vectorizer).fit_transform([resume_text, required_text])
             
             # Calculate cosine similarity
             similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
@@ -147,25 +217,16 @@ class SkillAnalyzer:
         Returns:
             Dictionary containing analysis results
         """
-        # Convert resume skills dict to list
-        resume_skill_list = list(resume_skills.keys())
-        
-        # Calculate metrics
-        match_percentage = self.calculate_skill_match_percentage(resume_skill_list, required_skills)
-        matched_skills = self.find_matched_skills(resume_skill_list, required_skills)
-        missing_skills = self.find_missing_skills(resume_skill_list, required_skills)
+        # Matched, missing, percentage and strengths from one pass
+        matched_skills, missing_skills, resume_index = self._match_skills(resume_skills, required_skills)
+        match_percentage = self._match_percentage(len(matched_skills), len(required_skills))
         similarity_score = self.calculate_skill_similarity_score(resume_skills, required_skills)
         
-        # Calculate skill strength for matched skills
-        skill_strengths = {}
-        for skill in matched_skills:
-            if skill.lower() in [s.lower() for s in resume_skills.keys()]:
-                # Find the skill in resume_skills (case-insensitive)
-                resume_skill = next(
-                    (s for s in resume_skills.keys() if s.lower() == skill.lower()),
-                    skill
-                )
-                skill_strengths[skill] = resume_skills.get(resume_skill, 0.0)
+        # Skill strength of each matched skill, looked up case-insensitively
+        skill_strengths = {
+            skill: resume_skills[resume_index[skill.lower()]]
+            for skill in matched_skills
+        }
         
         # Determine proficiency level
         if match_percentage >= 80:
@@ -198,6 +259,24 @@ class SkillAnalyzer:
             'recommendations': self._generate_recommendations(missing_skills, match_percentage)
         }
     
+    def analyze_skill_gaps_batch(self, resume_skills_batch: List[Dict[str, float]],
+                                 required_skills: List[str]) -> List[Dict]:
+        """
+        Perform skill gap analysis for many resumes against the same role
+        
+        Args:
+            resume_skills_batch: Skill score dictionaries, e.g. from
+                SkillExtractor.extract_skills_batch
+            required_skills: List of required skills
+            
+        Returns:
+            One analysis dictionary per resume, as returned by analyze_skill_gaps
+        """
+        return [
+            self.analyze_skill_gaps(resume_skills, required_skills)
+            for resume_skills in resume_skills_batch
+        ]
+    
     def _generate_recommendations(self, missing_skills: List[str], match_percentage: float) -> List[str]:
         """
         Generate personalized recommendations based on skill gaps
@@ -245,29 +324,63 @@ class SkillAnalyzer:
         Returns:
             Category-wise analysis
         """
-        category_analysis = {}
+        category_names, category_index = self._get_category_index(skill_categories)
+        resume_index = {skill.lower() for skill in resume_skills}
         
-        for category, category_skills in skill_categories.items():
-            # Find required skills in this category
-            required_in_category = [skill for skill in required_skills if skill in category_skills]
-            
-            if required_in_category:
-                # Find matched skills in this category
-                resume_skill_list = list(resume_skills.keys())
-                matched_in_category = self.find_matched_skills(resume_skill_list, required_in_category)
-                
-                # Calculate category match percentage
-                category_match = self.calculate_skill_match_percentage(
-                    matched_in_category, required_in_category
-                )
-                
-                category_analysis[category] = {
-                    'required_skills': required_in_category,
-                    'matched_skills': matched_in_category,
-                    'missing_skills': self.find_missing_skills(matched_in_category, required_in_category),
-                    'match_percentage': category_match,
-                    'total_required': len(required_in_category),
-                    'total_matched': len(matched_in_category)
-                }
+        # One pass over the required skills, routed to their categories through
+        # the reverse index: [required, matched, missing, first spelling by key]
+        categories = {}
+        for skill in required_skills:
+            category_ids = category_index.get(skill)
+            if not category_ids:
+                continue
+            key = skill.lower()
+            for category_id in category_ids:
+                category = categories.get(category_id)
+                if category is None:
+                    category = categories[category_id] = ([], [], [], {})
+                required, matched, missing, original_case = category
+                required.append(skill)
+                original = original_case.setdefault(key, skill)
+                if key in resume_index:
+                    matched.append(original)
+                else:
+                    missing.append(original)
+        
+        category_analysis = {}
+        for category_id in sorted(categories):
+            required, matched, missing, _ = categories[category_id]
+            category_analysis[category_names[category_id]] = {
+                'required_skills': required,
+                'matched_skills': matched,
+                'missing_skills': missing,
+                'match_percentage': self._match_percentage(len(matched), len(required)),
+                'total_required': len(required),
+                'total_matched': len(matched)
+            }
         
         return category_analysis
+    
+    def _get_category_index(self, skill_categories: Dict[str, List[str]]) -> Tuple[List[str], Dict[str, Tuple[int, ...]]]:
+        """
+        Get the skill -> category ids reverse index of a category mapping
+        
+        The index is built once per mapping object (callers pass the same
+        knowledge base dict on every call) and treats the mapping as read-only.
+        
+        Args:
+            skill_categories: Dictionary of skill categories
+            
+        Returns:
+            Category names in mapping order, and the category ids listing each skill
+        """
+        source, category_names, category_index = self._category_index
+        if source is not skill_categories:
+            category_names = list(skill_categories)
+            category_index = {}
+            for category_id, category_skills in enumerate(skill_categories.values()):
+                for skill in dict.fromkeys(category_skills):
+                    category_index[skill] = category_index.get(skill, ()) + (category_id,)
+            self._category_index = (skill_categories, category_names, category_index)
+        return category_names, category_index
+